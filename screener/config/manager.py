@@ -2,12 +2,111 @@
 
 import json
 import logging
+import math
+import os
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, List
+from typing import Any, Iterator, Optional, List, Union
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib encoder
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
 
+def _has_non_finite(data: Any) -> bool:
+    """Return True if data contains a NaN or infinite float anywhere."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+def _dumps(data: Any, indent: bool = True) -> bytes:
+    """Serialize data as JSON bytes, using orjson when available.
+
+    Output is indented by two spaces unless ``indent`` is False, in which case
+    it is written without any whitespace. Data orjson cannot write faithfully
+    (NaN or Infinity, which it would turn into null, and ints wider than
+    64 bits) goes through the stdlib encoder instead.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, option=option)
+        except TypeError:
+            pass
+    if indent:
+        return json.dumps(data, indent=2).encode("utf-8")
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available.
+
+    orjson rejects the NaN and Infinity literals the stdlib encoder writes, so
+    documents it cannot parse are retried with the stdlib parser. Invalid JSON
+    still raises json.JSONDecodeError.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw)
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a file's bytes, cached on its modification time and size.
+
+    The key is only as fine as the filesystem's timestamps: a rewrite that
+    keeps the same size and lands within one mtime tick (coarse on some
+    filesystems, e.g. 2 s on FAT) is served stale. Writes made through
+    ``_write_json`` clear the cache; files edited by hand or by another
+    process while the screener runs rely on the mtime changing.
+    """
+    return Path(path).read_bytes()
+
+
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, skipping the disk read when it is unchanged.
+
+    Only the raw bytes are cached; every call parses a fresh object, so callers
+    may mutate the result.
+    """
+    stat = path.stat()
+    return _loads(_read_cached(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def _write_json(path: Path, data: Any, indent: bool = True) -> None:
+    """Write data to a JSON file atomically.
+
+    The bytes go to a sibling temporary file that then replaces the target, so
+    readers never see a partially written file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(_dumps(data, indent))
+        os.replace(tmp_path, path)
+    except BaseException:
+        # Don't leave a partial temporary file behind
+        with suppress(OSError):
+            tmp_path.unlink()
+        raise
+    _read_cached.cache_clear()
+
+
 class ValidationError(Exception):
     """Exception raised for parameter validation errors."""
     pass
@@ -35,16 +134,20 @@ class ConfigManager:
         'earnings_buffer_days': (0, 365),
     }
     
-    def __init__(self, config_path: str = "config/screener_config.json",
-                 presets_path: str = "config/user_presets.json",
-                 strategies_dir: str = "config/strategies"):
+    def __init__(self, config_path: Union[str, os.PathLike] = "config/screener_config.json",
+                 presets_path: Union[str, os.PathLike] = "config/user_presets.json",
+                 strategies_dir: Union[str, os.PathLike] = "config/strategies",
+                 autosave: bool = True):
         """
         Initialize the ConfigManager.
         
         Args:
-            config_path: Path to the configuration JSON file
-            presets_path: Path to the user presets JSON file
+            config_path: Path to the configuration JSON file (str or path-like)
+            presets_path: Path to the user presets JSON file (str or path-like)
             strategies_dir: Path to the directory containing strategy configs
+                (str or path-like)
+            autosave: Write presets to disk as soon as they are saved. When False,
+                preset changes stay in memory until save() is called.
         """
         self.config_path = Path(config_path)
         self.presets_path = Path(presets_path)
@@ -52,6 +155,8 @@ class ConfigManager:
         self.config: dict = {}
         self.presets: dict = {}
         self.strategy_configs: dict = {}
+        self._autosave = autosave
+        self._dirty = False
         self.load_config()
         self._load_presets()
     
@@ -72,8 +177,7 @@ class ConfigManager:
             return self.config
         
         try:
-            with open(self.config_path, 'r') as f:
-                self.config = json.load(f)
+            self.config = _read_json(self.config_path)
             logger.info(f"Configuration loaded from {self.config_path}")
             return self.config
         except json.JSONDecodeError as e:
@@ -121,14 +225,15 @@ class ConfigManager:
             >>> config.get("finviz.timeout", 30)
             30
         """
-        keys = key_path.split('.')
         value = self.config
         
-        for key in keys:
-            if isinstance(value, dict) and key in value:
+        # Config values are plain JSON types, so indexing a non-dict raises
+        # TypeError and a missing key raises KeyError; both mean "not found"
+        try:
+            for key in key_path.split('.'):
                 value = value[key]
-            else:
-                return default
+        except (KeyError, TypeError):
+            return default
         
         return value
     
@@ -161,20 +266,71 @@ class ConfigManager:
         """
         Save the current configuration to the JSON file.
         
+        Presets whose write was deferred (autosave disabled) are written too.
+        
         Raises:
-            IOError: If unable to write to config file
+            IOError: If unable to write to config or presets file
         """
         try:
-            # Ensure parent directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.config_path, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Keep the config indented; it is also edited by hand
+            _write_json(self.config_path, self.config)
             
             logger.info(f"Configuration saved to {self.config_path}")
         except IOError as e:
             logger.error(f"Failed to save configuration: {e}")
             raise
+        
+        if self._dirty:
+            self._write_presets()
+    
+    @contextmanager
+    def batched(self) -> Iterator["ConfigManager"]:
+        """
+        Defer preset writes until the end of the block.
+        
+        Presets saved inside the block are kept in memory and written to disk
+        once on exit. If the block raises, they are still written, but a
+        failure to write them is only logged so the block's own exception
+        propagates.
+        
+        Example:
+            >>> with config.batched():
+            ...     config.save_preset("aggressive", "PCS", {"rsi_min": 40})
+            ...     config.save_preset("conservative", "PCS", {"rsi_min": 50})
+        """
+        previous = self._autosave
+        self._autosave = False
+        try:
+            yield self
+        except BaseException:
+            self._autosave = previous
+            if self._dirty:
+                try:
+                    self._write_presets()
+                except Exception as e:
+                    logger.error(f"Failed to write deferred presets: {e}")
+            raise
+        
+        self._autosave = previous
+        if self._dirty:
+            self._write_presets()
+    
+    def _write_presets(self) -> None:
+        """
+        Write all presets to the presets JSON file.
+        
+        The presets file is only managed through this class, so it is written
+        compactly to keep rewrites small.
+        
+        Raises:
+            IOError: If unable to write to presets file
+        """
+        try:
+            _write_json(self.presets_path, self.presets, indent=False)
+            self._dirty = False
+        except IOError as e:
+            logger.error(f"Failed to save presets: {e}")
+            raise
     
     def _load_presets(self) -> dict:
         """
@@ -189,8 +345,7 @@ class ConfigManager:
             return self.presets
         
         try:
-            with open(self.presets_path, 'r') as f:
-                self.presets = json.load(f)
+            self.presets = _read_json(self.presets_path)
             logger.info(f"Presets loaded from {self.presets_path}")
             return self.presets
         except json.JSONDecodeError as e:
@@ -259,16 +414,11 @@ class ConfigManager:
             self.presets[strategy] = {}
         
         self.presets[strategy][name] = filters
+        self._dirty = True
         
-        # Save to file
-        try:
-            self.presets_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.presets_path, 'w') as f:
-                json.dump(self.presets, f, indent=2)
-            logger.info(f"Preset '{name}' saved for strategy '{strategy}'")
-        except IOError as e:
-            logger.error(f"Failed to save preset: {e}")
-            raise
+        if self._autosave:
+            self._write_presets()
+        logger.info(f"Preset '{name}' saved for strategy '{strategy}'")
     
     def load_preset(self, name: str, strategy: str) -> Optional[dict]:
         """
@@ -350,8 +500,7 @@ class ConfigManager:
         for config_file in possible_paths:
             if config_file.exists():
                 try:
-                    with open(config_file, 'r') as f:
-                        strategy_config = json.load(f)
+                    strategy_config = _read_json(config_file)
                     
                     # Cache the loaded config
                     self.strategy_configs[strategy_name] = strategy_config
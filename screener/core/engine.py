@@ -1,5 +1,6 @@
 """Core screening engine that orchestrates the stock screening workflow."""
 
+import numpy as np
 import pandas as pd
 from typing import Dict, Any, Optional
 from screener.core.models import ScreenerResults, StockData
@@ -70,7 +71,8 @@ class ScreeningEngine:
         1. Loads the specified strategy
         2. Retrieves stock data (from Finviz or provided DataFrame)
         3. Applies filters to the data
-        4. Scores each stock using the strategy
+        4. Scores each stock using the strategy (in one call if the strategy
+           provides an optional ``score_vectorized(df)`` method)
         5. Ranks results by score
         6. Returns structured results
         
@@ -110,17 +112,21 @@ class ScreeningEngine:
         
         # Score each stock
         if len(filtered_df) > 0:
-            # Convert DataFrame rows to StockData objects and score them
-            scores = []
-            for _, row in filtered_df.iterrows():
-                try:
-                    stock_data = self._row_to_stock_data(row)
-                    score = strategy.score_stock(stock_data)
-                    scores.append(score)
-                except Exception as e:
-                    # If scoring fails, assign a low score
-                    print(f"Warning: Failed to score {row.get('ticker', 'unknown')}: {e}")
-                    scores.append(0.0)
+            # Strategy may score the whole frame at once, skipping the per-row loop
+            scores = self._score_vectorized(strategy, filtered_df)
+            
+            if scores is None:
+                # Convert DataFrame rows to StockData objects and score them
+                scores = []
+                for _, row in filtered_df.iterrows():
+                    try:
+                        stock_data = self._row_to_stock_data(row)
+                        score = strategy.score_stock(stock_data)
+                        scores.append(score)
+                    except Exception as e:
+                        # If scoring fails, assign a low score
+                        print(f"Warning: Failed to score {row.get('ticker', 'unknown')}: {e}")
+                        scores.append(0.0)
             
             filtered_df['strategy_score'] = scores
         else:
@@ -143,6 +149,33 @@ class ScreeningEngine:
         
         return results
     
+    def _score_vectorized(self, strategy: StrategyModule, stocks_df: pd.DataFrame) -> Optional[np.ndarray]:
+        """
+        Score a whole frame through the strategy's optional ``score_vectorized`` hook.
+        
+        Args:
+            strategy: Strategy module used for scoring
+            stocks_df: Filtered, non-empty DataFrame of stocks
+            
+        Returns:
+            One float score per row, or None if the strategy has no hook, the
+            hook raises, or it returns the wrong number of scores; the caller
+            then scores row by row.
+        """
+        score_vectorized = getattr(strategy, 'score_vectorized', None)
+        if score_vectorized is None:
+            return None
+        
+        try:
+            scores = np.asarray(score_vectorized(stocks_df), dtype=float)
+            if scores.shape != (len(stocks_df),):
+                raise ValueError(f"expected {len(stocks_df)} scores, got shape {scores.shape}")
+        except Exception as e:
+            print(f"Warning: Vectorized scoring failed for {strategy.name}, scoring row by row: {e}")
+            return None
+        
+        return scores
+    
     def apply_filters(
         self,
         stocks_df: pd.DataFrame,
@@ -1,15 +1,76 @@
 """Storage manager for persisting screening results and history."""
 
 import json
+import math
 import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 import pandas as pd
 
 from screener.core.models import ScreenerResults, ScreeningSession
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to the stdlib encoder
+    orjson = None
+
+
+def _has_non_finite(data: Any) -> bool:
+    """Return True if data contains a NaN or infinite float anywhere."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+def _str_default(value: Any) -> Any:
+    """Encode a value orjson does not handle natively the way ``json.dump(default=str)`` would.
+
+    The stdlib encoder writes float subclasses such as ``numpy.float64`` as
+    numbers, so those stay numeric; everything else becomes ``str(value)``.
+    """
+    if isinstance(value, float):
+        return float(value)
+    return str(value)
+
+
+def _dumps(data: Any, strict: bool = False) -> bytes:
+    """Serialize data as indented UTF-8 JSON bytes, using orjson when available.
+
+    The output parses to the same values as ``json.dumps(data, indent=2,
+    default=str)``: datetimes and other values the stdlib encoder cannot
+    handle are written as ``str(value)``. With ``strict`` such values raise
+    TypeError instead, as plain ``json.dumps`` does. The bytes are not
+    identical: orjson writes non-ASCII text unescaped and may format floats
+    differently (``1e-7`` rather than ``1e-07``), so readers must decode the
+    file as UTF-8. Payloads orjson cannot write faithfully (non-string keys,
+    NaN or Infinity, ints wider than 64 bits) go through the stdlib encoder.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        option = orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+        try:
+            return orjson.dumps(data, default=None if strict else _str_default, option=option)
+        except TypeError:
+            pass
+    return json.dumps(data, indent=2, default=None if strict else str).encode("utf-8")
+
+
+def _read_json(path) -> Any:
+    """Parse a JSON file written by ``_dumps``, which is always UTF-8."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _write_bytes(path, payload: bytes) -> None:
+    """Write a fully serialized payload to a file in one buffered write call."""
+    with open(path, 'wb') as f:
+        f.write(payload)
+
 
 class StorageError(Exception):
     """Base exception for storage operations."""
@@ -38,6 +99,9 @@ class StorageManager:
         """
         Save screening results to local storage with timestamp.
         
+        Only the JSON record and the history entry are written; a CSV copy is
+        produced on demand by ``export_saved_csv``.
+        
         Args:
             results: ScreenerResults object to save
             strategy: Strategy name used for screening
@@ -55,10 +119,6 @@ class StorageManager:
         json_path = self.results_dir / f"{result_id}.json"
         self._save_as_json(results, json_path)
         
-        # Save as CSV
-        csv_path = self.results_dir / f"{result_id}.csv"
-        self._save_as_csv(results, csv_path)
-        
         # Update history log
         self._add_to_history(result_id, results, strategy)
         
@@ -88,8 +148,7 @@ class StorageManager:
         # Try to load with retry logic
         for attempt in range(self.max_retries + 1):
             try:
-                with open(json_path, 'r') as f:
-                    data = json.load(f)
+                data = _read_json(json_path)
                 
                 # Reconstruct ScreenerResults
                 results = ScreenerResults(
@@ -108,6 +167,26 @@ class StorageManager:
                 else:
                     raise StorageError(f"Failed to load results after {self.max_retries + 1} attempts: {e}")
     
+    def export_saved_csv(self, result_id: str) -> Path:
+        """
+        Write a saved result's stocks next to its JSON record as CSV.
+        
+        Args:
+            result_id: Result ID (filename without extension)
+            
+        Returns:
+            Path of the written CSV file
+            
+        Raises:
+            FileNotFoundError: If result ID doesn't exist
+            StorageError: If the file cannot be read or written after retries
+            
+        Requirements: 6.3
+        """
+        csv_path = self.results_dir / f"{result_id}.csv"
+        self._save_as_csv(self.load_results(result_id), csv_path)
+        return csv_path
+    
     def _save_as_json(self, results: ScreenerResults, path: Path) -> None:
         """
         Save results as JSON file with retry logic.
@@ -116,15 +195,14 @@ class StorageManager:
         """
         for attempt in range(self.max_retries + 1):
             try:
-                with open(path, 'w') as f:
-                    data = {
-                        'timestamp': results.timestamp.isoformat(),
-                        'strategy': results.strategy,
-                        'filters': results.filters,
-                        'stocks': results.stocks.to_dict(orient='records'),
-                        'metadata': results.metadata
-                    }
-                    json.dump(data, f, indent=2, default=str)
+                data = {
+                    'timestamp': results.timestamp.isoformat(),
+                    'strategy': results.strategy,
+                    'filters': results.filters,
+                    'stocks': results.stocks.to_dict(orient='records'),
+                    'metadata': results.metadata
+                }
+                _write_bytes(path, _dumps(data))
                 return  # Success
             except (IOError, OSError) as e:
                 if attempt < self.max_retries:
@@ -141,7 +219,7 @@ class StorageManager:
         """
         for attempt in range(self.max_retries + 1):
             try:
-                results.stocks.to_csv(path, index=False)
+                _write_bytes(path, results.stocks.to_csv(index=False).encode("utf-8"))
                 return  # Success
             except (IOError, OSError) as e:
                 if attempt < self.max_retries:
@@ -169,8 +247,7 @@ class StorageManager:
         history.append(session)
         
         # Save updated history
-        with open(self.history_file, 'w') as f:
-            json.dump(history, f, indent=2)
+        _write_bytes(self.history_file, _dumps(history, strict=True))
     
     def _load_history(self) -> list:
         """
@@ -184,8 +261,7 @@ class StorageManager:
         # Try to load with retry logic
         for attempt in range(self.max_retries + 1):
             try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                return _read_json(self.history_file)
             except (IOError, OSError, json.JSONDecodeError) as e:
                 if attempt < self.max_retries:
                     time.sleep(0.1 * (attempt + 1))  # Exponential backoff
@@ -225,8 +301,7 @@ class StorageManager:
             'metadata': results.metadata
         }
         
-        with open(path, 'w') as f:
-            json.dump(data, f, indent=2, default=str)
+        _write_bytes(path, _dumps(data))
     
     def get_history(self, limit: int = 50) -> list:
         """
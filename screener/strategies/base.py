@@ -11,6 +11,13 @@ class StrategyModule(ABC):
     
     Each strategy module defines screening criteria, scoring logic,
     and analysis methods specific to a particular options trading strategy.
+    
+    Strategies may also define an optional ``score_vectorized(df)`` method.
+    ScreeningEngine.screen_stocks calls it once with the filtered DataFrame
+    instead of calling score_stock for each row. It must return one 0-100
+    score per row, in row order, as an array-like of floats. If it raises
+    or returns a different number of scores, the engine falls back to
+    score_stock row by row.
     """
     
     @property
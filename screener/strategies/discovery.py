@@ -3,19 +3,81 @@
 import importlib
 import importlib.util
 import inspect
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Type
+from typing import Dict, Tuple, Type, Union
 from screener.strategies.base import StrategyModule
 
 
-def discover_strategies(strategies_dir: str = None) -> Dict[str, StrategyModule]:
+def _module_files(strategies_path: Path) -> Tuple[Tuple[str, int, int], ...]:
+    """Return ``(path, mtime_ns, size)`` for each strategy file.
+
+    Matches the same names as ``Path.glob("*_strategy.py")``, dotfiles
+    included, in a single directory scan. Files are returned in directory
+    order, as glob returns them, so the same file wins when two modules
+    register the same strategy name.
+    """
+    files = []
+    try:
+        with os.scandir(strategies_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith("_strategy.py"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    # Removed since the directory was listed
+                    continue
+                files.append((entry.path, stat.st_mtime_ns, stat.st_size))
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+    return tuple(files)
+
+
+@lru_cache(maxsize=256)
+def _load_strategy_classes(file_name: str, mtime_ns: int, size: int,
+                           use_standard_import: bool) -> Tuple[Type[StrategyModule], ...]:
+    """Import a strategy file and return the StrategyModule subclasses it defines.
+
+    Cached on the file's path, modification time and size, so a file is only
+    re-imported once it changes. A rewrite that keeps the size within one
+    timestamp tick is not noticed, the same limit Python's bytecode cache has.
+    Failed imports raise and are not cached.
+    """
+    file_path = Path(file_name)
+    if use_standard_import:
+        # Use standard import for modules in the package
+        module_name = f"screener.strategies.{file_path.stem}"
+        module = importlib.import_module(module_name)
+    else:
+        # Use dynamic import for arbitrary directories (e.g., testing)
+        module_name = file_path.stem
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec is None or spec.loader is None:
+            return ()
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    
+    # Look for classes that inherit from StrategyModule (but not StrategyModule itself)
+    return tuple(
+        obj for _name, obj in inspect.getmembers(module, inspect.isclass)
+        if (issubclass(obj, StrategyModule) and
+            obj is not StrategyModule and
+            obj.__module__ == module_name)
+    )
+
+
+def discover_strategies(strategies_dir: Union[str, os.PathLike] = None) -> Dict[str, StrategyModule]:
     """
     Automatically discover and register strategy modules.
     
     Scans the strategies directory for Python files matching the pattern
     '*_strategy.py' and attempts to import and instantiate strategy classes
-    that inherit from StrategyModule.
+    that inherit from StrategyModule. Imported classes are reused until their
+    file changes, but every call returns new strategy instances.
     
     Args:
         strategies_dir: Optional path to strategies directory. 
@@ -29,8 +91,6 @@ def discover_strategies(strategies_dir: str = None) -> Dict[str, StrategyModule]
         >>> print(strategies.keys())
         dict_keys(['Put Credit Spread', 'Covered Call', ...])
     """
-    strategies = {}
-    
     # Determine the strategies directory
     if strategies_dir is None:
         # Default to the strategies directory relative to this file
@@ -40,45 +100,26 @@ def discover_strategies(strategies_dir: str = None) -> Dict[str, StrategyModule]
         strategies_path = Path(strategies_dir)
         use_standard_import = False
     
-    # Scan for strategy files
-    for file_path in strategies_path.glob("*_strategy.py"):
+    strategies = {}
+    
+    for file_name, mtime_ns, size in _module_files(strategies_path):
         try:
-            if use_standard_import:
-                # Use standard import for modules in the package
-                module_name = f"screener.strategies.{file_path.stem}"
-                module = importlib.import_module(module_name)
-            else:
-                # Use dynamic import for arbitrary directories (e.g., testing)
-                module_name = file_path.stem
-                spec = importlib.util.spec_from_file_location(module_name, file_path)
-                if spec is None or spec.loader is None:
-                    continue
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-            
-            # Look for classes that inherit from StrategyModule
-            for name, obj in inspect.getmembers(module, inspect.isclass):
-                # Check if it's a StrategyModule subclass (but not StrategyModule itself)
-                if (issubclass(obj, StrategyModule) and 
-                    obj is not StrategyModule and
-                    obj.__module__ == module_name):
-                    
-                    # Instantiate the strategy
-                    strategy_instance = obj()
-                    
-                    # Register by strategy name
-                    strategies[strategy_instance.name] = strategy_instance
-                    
+            for strategy_class in _load_strategy_classes(file_name, mtime_ns, size, use_standard_import):
+                # Instantiate the strategy
+                strategy_instance = strategy_class()
+                
+                # Register by strategy name
+                strategies[strategy_instance.name] = strategy_instance
+                
         except Exception as e:
             # Log the error but continue discovering other strategies
-            print(f"Warning: Failed to load strategy from {file_path}: {e}")
+            print(f"Warning: Failed to load strategy from {file_name}: {e}")
             continue
     
     return strategies
 
 
-def get_strategy(strategy_name: str, strategies_dir: str = None) -> StrategyModule:
+def get_strategy(strategy_name: str, strategies_dir: Union[str, os.PathLike] = None) -> StrategyModule:
     """
     Get a specific strategy by name.
     
@@ -104,7 +145,7 @@ def get_strategy(strategy_name: str, strategies_dir: str = None) -> StrategyModu
     return strategies[strategy_name]
 
 
-def list_available_strategies(strategies_dir: str = None) -> list[str]:
+def list_available_strategies(strategies_dir: Union[str, os.PathLike] = None) -> list[str]:
     """
     List all available strategy names.
     
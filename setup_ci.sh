@@ -6,7 +6,7 @@ echo "🚀 Setting up CI/CD and code quality tools..."
 # Install development dependencies
 echo "📦 Installing development dependencies..."
 pip install --upgrade pip
-pip install black flake8 pylint bandit safety pytest pytest-cov pre-commit
+pip install black flake8 pylint bandit safety pytest pytest-cov pytest-xdist pyfakefs pre-commit
 
 # Format code with Black
 echo "✨ Formatting code with Black..."
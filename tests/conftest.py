@@ -0,0 +1,172 @@
+"""Shared pytest fixtures for the unit tests."""
+
+import os
+import shutil
+import sys
+from contextlib import contextmanager
+from uuid import uuid4
+import pytest
+from hypothesis import settings
+from unittest.mock import Mock
+
+from screener.config.manager import ConfigManager
+from src.brokers.base_client import BaseBrokerClient, Position
+from src.logging.bot_logger import BotLogger
+from src.positions.position_service import PositionService
+
+# Property tests without their own @settings use this profile. Set
+# HYPO_PROFILE=thorough to run them with Hypothesis' usual 100 examples, or
+# HYPO_PROFILE=ci for the same examples drawn from a fixed seed.
+settings.register_profile("fast", max_examples=25, deadline=None)
+settings.register_profile("thorough", max_examples=100, deadline=None)
+settings.register_profile("ci", parent=settings.get_profile("thorough"), derandomize=True)
+settings.load_profile(os.getenv("HYPO_PROFILE", "fast"))
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_bytecode():
+    """Don't write .pyc files while the suite runs.
+
+    Discovery tests import hundreds of throwaway strategy modules; their
+    bytecode would never be reused. Existing caches are still read.
+    """
+    previous = sys.dont_write_bytecode
+    sys.dont_write_bytecode = True
+    yield
+    sys.dont_write_bytecode = previous
+
+
+@pytest.fixture(scope="module")
+def mock_broker_client():
+    """Create a mock broker client shared across a test module.
+
+    ``spec_set`` limits the mock to the BaseBrokerClient interface, so a
+    misspelled method fails immediately instead of returning a child mock.
+    """
+    return Mock(spec_set=BaseBrokerClient)
+
+
+@pytest.fixture(scope="module")
+def mock_logger():
+    """Create a mock BotLogger shared across a test module."""
+    return Mock(spec_set=BotLogger)
+
+
+def _discard(*args, **kwargs):
+    """Accept and drop a log call."""
+
+
+@pytest.fixture
+def silent_logger(mock_logger):
+    """Turn the shared logger's info and warning methods into no-ops for one test.
+
+    Tests that do not assert on logging skip recording those calls. Errors are
+    still recorded, and the original methods are restored afterwards.
+    """
+    originals = {name: getattr(mock_logger, name) for name in ("log_info", "log_warning")}
+    for name in originals:
+        setattr(mock_logger, name, _discard)
+    yield mock_logger
+    for name, method in originals.items():
+        setattr(mock_logger, name, method)
+
+
+@pytest.fixture(scope="module")
+def position_service(mock_broker_client, mock_logger):
+    """Create a PositionService wired to the shared mocks."""
+    return PositionService(mock_broker_client, mock_logger)
+
+
+@pytest.fixture(scope="session")
+def make_position():
+    """Return a factory for real Position instances.
+
+    Using the dataclass itself keeps tests on the broker schema: a misspelled
+    field (e.g. ``average_cost``) fails when the position is built or read.
+    """
+    def _make(symbol, quantity, market_value=0.0, avg_cost=0.0, current_price=0.0):
+        return Position(
+            symbol=symbol,
+            quantity=quantity,
+            avg_cost=avg_cost,
+            current_price=current_price,
+            market_value=market_value,
+        )
+    return _make
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks(request):
+    """Clear recorded calls, return values and side effects between tests.
+
+    Only mocks the test actually requested are reset, so modules that do not
+    use the shared fixtures never instantiate them.
+    """
+    for name in ("mock_broker_client", "mock_logger"):
+        if name in request.fixturenames:
+            request.getfixturevalue(name).reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture(scope="module")
+def shared_config(tmp_path_factory):
+    """Create one screener ConfigManager per module in a temporary directory.
+
+    Property tests that only validate parameters reuse it across examples.
+    It is never saved; tests that write files use ``fresh_config``.
+    """
+    directory = tmp_path_factory.mktemp("cfg")
+    return ConfigManager(str(directory / "config.json"), str(directory / "presets.json"))
+
+
+@pytest.fixture(scope="module")
+def fresh_config(tmp_path_factory):
+    """Return a context manager yielding a ConfigManager in a new empty directory.
+
+    Hypothesis tests enter it once per example; the directory lives under one
+    module-scoped root and is removed when the block exits.
+    """
+    root = tmp_path_factory.mktemp("cfg_examples")
+
+    @contextmanager
+    def _fresh(**kwargs):
+        directory = root / uuid4().hex
+        directory.mkdir()
+        try:
+            yield ConfigManager(str(directory / "config.json"), str(directory / "presets.json"), **kwargs)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+    return _fresh
+
+
+@pytest.fixture(scope="session")
+def real_config_manager():
+    """ConfigManager over the repository's real config files, loaded once per session.
+
+    Tests must not modify it; anything that saves should use ``fresh_config``
+    or its own temporary directory.
+    """
+    return ConfigManager()
+
+
+@pytest.fixture(scope="session")
+def real_pcs(real_config_manager):
+    """The real PCS strategy config, parsed once per session."""
+    return real_config_manager.load_strategy_config("PCS")
+
+
+@pytest.fixture(scope="session")
+def strategies_root(tmp_path_factory):
+    """One temporary root for strategy files per session.
+
+    Under xdist each worker has its own session and base temporary directory,
+    so workers never share a root.
+    """
+    return tmp_path_factory.mktemp("strategies")
+
+
+@pytest.fixture
+def strategies_dir(strategies_root, request):
+    """An empty strategies directory under the worker's root, named after the test."""
+    directory = strategies_root / f"{request.module.__name__}.{request.node.name}"
+    directory.mkdir()
+    return directory
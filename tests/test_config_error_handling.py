@@ -241,3 +241,31 @@ def test_config_reload_after_corruption():
         # Should fall back to defaults
         assert config.get("finviz.credentials_path") == ".env"
         assert config.get("finviz.rate_limit_delay") == 1.0
+
+
+def test_non_finite_config_values_roundtrip():
+    """
+    Test that NaN and Infinity written by json.dump survive a load and save.
+    
+    Requirements: 7.5
+    """
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.json"
+        presets_path = Path(tmpdir) / "presets.json"
+        
+        # The stdlib encoder writes these as bare NaN/Infinity literals
+        with open(config_path, 'w') as f:
+            json.dump({"finviz": {"rate_limit_delay": float("nan")},
+                       "analysis": {"risk_free_rate": float("inf"),
+                                    "large_value": 2 ** 70}}, f)
+        
+        config = ConfigManager(str(config_path), str(presets_path))
+        config.save()
+        
+        # The file is neither replaced by defaults nor rewritten with nulls
+        with open(config_path) as f:
+            saved = json.load(f)
+        assert saved["finviz"]["rate_limit_delay"] != saved["finviz"]["rate_limit_delay"]
+        assert saved["analysis"]["risk_free_rate"] == float("inf")
+        assert saved["analysis"]["large_value"] == 2 ** 70
+        assert ConfigManager(str(config_path), str(presets_path)).get("analysis.large_value") == 2 ** 70
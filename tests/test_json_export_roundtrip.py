@@ -85,7 +85,7 @@ def test_json_export_roundtrip_preserves_data(strategy_name, filters, stocks, me
         assert json_path.exists(), "JSON export file should exist"
         
         # Import from JSON
-        with open(json_path, 'r') as f:
+        with open(json_path, 'r', encoding='utf-8') as f:
             imported_data = json.load(f)
         
         # Reconstruct ScreenerResults from imported data
@@ -145,7 +145,7 @@ def test_json_export_contains_all_fields(strategy_name, filters, stocks):
         storage.export_to_json(results, str(json_path))
         
         # Load and verify JSON structure
-        with open(json_path, 'r') as f:
+        with open(json_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
         
         # Verify all required fields are present
@@ -163,3 +163,36 @@ def test_json_export_contains_all_fields(strategy_name, filters, stocks):
     finally:
         # Clean up temporary directory
         shutil.rmtree(temp_storage_dir)
+
+
+def test_json_export_matches_stdlib_encoding(tmp_path):
+    """
+    For ASCII text, exported bytes match json.dumps(indent=2, default=str), so
+    every timestamp is written in the same str() format whichever encoder is
+    installed.
+    """
+    stocks = pd.DataFrame({
+        'ticker': ['AAPL', 'MSFT'],
+        'price': [150.25, float('nan')],
+        'volume': [1_000_000, 2_000_000],
+        'earnings': pd.to_datetime(['2025-01-02 03:04:05', '2025-02-03 00:00:00']),
+    })
+    results = ScreenerResults(
+        timestamp=datetime(2025, 1, 2, 3, 4, 5),
+        strategy='pcs',
+        filters={'min_volume': 1000000},
+        stocks=stocks,
+        metadata={'fetched_at': datetime(2025, 1, 2, 3, 4, 5), 'source': 'finviz'}
+    )
+    path = tmp_path / "export.json"
+    
+    StorageManager(results_dir=str(tmp_path)).export_to_json(results, str(path))
+    
+    expected = json.dumps({
+        'timestamp': results.timestamp.isoformat(),
+        'strategy': results.strategy,
+        'filters': results.filters,
+        'stocks': stocks.to_dict(orient='records'),
+        'metadata': results.metadata
+    }, indent=2, default=str).encode("utf-8")
+    assert path.read_bytes() == expected
@@ -1,10 +1,7 @@
 """Property-based tests for multiple presets per strategy."""
 
 import pytest
-import tempfile
-from pathlib import Path
 from hypothesis import given, strategies as st, settings
-from screener.config import ConfigManager
 
 
 # Strategy for generating filter dictionaries
@@ -31,7 +28,7 @@ filter_strategy = st.fixed_dictionaries({
         unique_by=lambda x: x[0]  # Ensure unique preset names
     )
 )
-def test_multiple_presets_per_strategy(strategy_name, presets):
+def test_multiple_presets_per_strategy(fresh_config, strategy_name, presets):
     """
     Feature: strategy-stock-screener, Property 24: Multiple Presets Per Strategy
     
@@ -40,15 +37,11 @@ def test_multiple_presets_per_strategy(strategy_name, presets):
     
     Validates: Requirements 7.4
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.json"
-        presets_path = Path(tmpdir) / "presets.json"
-        
-        config = ConfigManager(str(config_path), str(presets_path))
-        
-        # Save all presets
-        for preset_name, filters in presets:
-            config.save_preset(preset_name, strategy_name, filters)
+    with fresh_config() as config:
+        # Save all presets, writing the file once
+        with config.batched():
+            for preset_name, filters in presets:
+                config.save_preset(preset_name, strategy_name, filters)
         
         # Verify all presets can be retrieved independently
         for preset_name, expected_filters in presets:
@@ -77,18 +70,13 @@ def test_multiple_presets_per_strategy(strategy_name, presets):
         ),
     })
 )
-def test_presets_isolated_across_strategies(presets_by_strategy):
+def test_presets_isolated_across_strategies(fresh_config, presets_by_strategy):
     """
     Test that presets for different strategies don't interfere with each other.
     
     Validates: Requirements 7.4
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.json"
-        presets_path = Path(tmpdir) / "presets.json"
-        
-        config = ConfigManager(str(config_path), str(presets_path))
-        
+    with fresh_config() as config:
         # Save presets for all strategies
         for strategy_name, presets in presets_by_strategy.items():
             for preset_name, filters in presets:
@@ -115,18 +103,13 @@ def test_presets_isolated_across_strategies(presets_by_strategy):
     filters1=filter_strategy,
     filters2=filter_strategy
 )
-def test_preset_overwrite(strategy_name, preset_name, filters1, filters2):
+def test_preset_overwrite(fresh_config, strategy_name, preset_name, filters1, filters2):
     """
     Test that saving a preset with the same name overwrites the previous one.
     
     Validates: Requirements 7.4
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.json"
-        presets_path = Path(tmpdir) / "presets.json"
-        
-        config = ConfigManager(str(config_path), str(presets_path))
-        
+    with fresh_config() as config:
         # Save first version
         config.save_preset(preset_name, strategy_name, filters1)
         
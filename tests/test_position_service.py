@@ -1,53 +1,138 @@
 """Unit tests for PositionService."""
 
+import contextlib
+import functools
+import re
+import numpy as np
 import pytest
 from datetime import date, timedelta
-from unittest.mock import Mock, MagicMock
-from dataclasses import dataclass
+from types import SimpleNamespace
+from unittest.mock import Mock
 
 from src.positions.position_service import PositionService
 from src.positions.models import PositionSummary, OptionPosition, CoveredCallOrder
 from src.positions.validation import PositionValidationSummary, ValidationResult
-from src.brokers.base_client import Position
+from src.brokers.base_client import BaseBrokerClient
 
+_NUMPY_MIN_OPTIONS = 64
 
-@dataclass
-class MockPosition:
-    """Mock position for testing."""
-    symbol: str
-    quantity: int
-    market_value: float = 0.0
-    average_cost: float = 0.0
+_ERR_EMPTY_SYMBOL = re.compile(r"Symbol cannot be empty")
+_ERR_NVDA = re.compile(r"Error retrieving positions for NVDA")
+_ERR_INVALID = re.compile(r"Error retrieving positions for INVALID")
 
+# Option expirations only need to be in the future, so compute them once.
+_TODAY = date.today()
+_EXP_30 = _TODAY + timedelta(days=30)
+_EXP_45 = _TODAY + timedelta(days=45)
 
-class TestPositionService:
-    """Test cases for PositionService."""
+# Order batches shared by the validation tests. The service only iterates them,
+# so tuples built once at import are safe to reuse.
+_NVDA_ORDERS_OK = (
+    CoveredCallOrder("NVDA", 155.0, _EXP_30, 2, 200),
+    CoveredCallOrder("NVDA", 160.0, _EXP_45, 1, 100),
+)
+_NVDA_ORDERS_INSUFFICIENT = (CoveredCallOrder("NVDA", 155.0, _EXP_30, 5, 500),)
+_NVDA_ORDERS_SINGLE = (CoveredCallOrder("NVDA", 155.0, _EXP_30, 1, 100),)
 
-    @pytest.fixture
-    def mock_broker_client(self):
-        """Create a mock broker client."""
-        client = Mock()
-        client.get_current_price = Mock()
-        client.get_position = Mock()
-        client.get_option_chain = Mock()
-        return client
 
-    @pytest.fixture
-    def mock_logger(self):
-        """Create a mock logger."""
-        logger = Mock()
-        logger.info = Mock()
-        logger.error = Mock()
-        logger.warning = Mock()
-        logger.log_info = Mock()
-        logger.log_error = Mock()
-        logger.log_warning = Mock()
-        return logger
+_OPTION_DTYPE = np.dtype([("qty", "i4"), ("is_short_call", "?")])
+
+
+def _pack_options(options):
+    """Pack option quantities and short-call flags into one structured array."""
+    return np.fromiter(
+        ((option.quantity,
+          option.option_type == 'call' and option.position_type == 'short_call')
+         for option in options),
+        dtype=_OPTION_DTYPE,
+        count=len(options),
+    )
+
+
+def _shares_covered_np(packed):
+    """Shares covered by the short calls in a ``_pack_options`` array."""
+    return int(np.abs(packed["qty"][packed["is_short_call"]]).sum()) * 100
+
+
+def _shares_covered(options):
+    """Shares covered by short calls, computed the way PositionService does.
+
+    Large option lists are packed and reduced with NumPy; below
+    ``_NUMPY_MIN_OPTIONS`` the array setup costs more than the plain generator sum.
+    """
+    if len(options) < _NUMPY_MIN_OPTIONS:
+        return sum(
+            abs(option.quantity) * 100 for option in options
+            if option.option_type == 'call' and option.position_type == 'short_call'
+        )
+    return _shares_covered_np(_pack_options(options))
+
+
+def _broker(price, position, detailed_positions=()):
+    """Plain stand-in broker for tests that never inspect broker calls."""
+    return SimpleNamespace(
+        get_current_price=lambda symbol: price,
+        get_position=lambda symbol: position,
+        get_detailed_positions=lambda symbol: list(detailed_positions),
+    )
+
+
+# These calculations never reach the broker, so one stub service serves them all.
+_STUB_SERVICE = PositionService(Mock(spec_set=BaseBrokerClient))
+
+
+# Service entry points exercised by the logging tests, keyed by test id.
+_OPERATIONS = {
+    "get_long_positions": lambda service: service.get_long_positions("NVDA"),
+    "validate_covered_call_orders": lambda service: service.validate_covered_call_orders(
+        "NVDA", _NVDA_ORDERS_OK[:1], 100
+    ),
+    "validate_single_covered_call": lambda service: service.validate_single_covered_call(
+        "NVDA", 155.0, _EXP_30, 2
+    ),
+    "get_position_validation_summary": lambda service: service.get_position_validation_summary(
+        "NVDA"
+    ),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _long_calls_tlt():
+    """Build the TLT long calls once per process; a test mutating them is a bug."""
+    return tuple(
+        OptionPosition(
+            symbol="TLT",
+            quantity=1,
+            market_value=150.0 - 10.0 * i,
+            average_cost=145.0 - 10.0 * i,
+            unrealized_pnl=5.0,
+            position_type='long_call',
+            strike=100.0 + 2.0 * i,
+            expiration=_EXP_30,
+            option_type='call'
+        )
+        for i in range(3)
+    )
+
+
+@pytest.fixture(scope="session")
+def long_calls_tlt():
+    """Three TLT long call contracts at strikes 100/102/104."""
+    return _long_calls_tlt()
 
-    @pytest.fixture
-    def position_service(self, mock_broker_client, mock_logger):
-        """Create a PositionService instance with mocks."""
-        return PositionService(mock_broker_client, mock_logger)
+
+@pytest.fixture
+def nvda_position(request, mock_broker_client, make_position):
+    """Mock an NVDA holding at $150; the share count comes from indirect parametrization."""
+    shares = getattr(request, "param", 500)
+    mock_broker_client.get_current_price.return_value = 150.0
+    mock_broker_client.get_position.return_value = make_position("NVDA", shares)
+    return shares
+
+
+@pytest.mark.usefixtures("silent_logger")
+class TestPositionService:
+    """Test cases for PositionService."""
 
     def test_initialization(self, position_service, mock_broker_client, mock_logger):
         """Test PositionService initialization."""
@@ -55,11 +140,11 @@ class TestPositionService:
         assert position_service.logger == mock_logger
         assert position_service.validator is not None
 
-    def test_get_long_positions_success(self, position_service, mock_broker_client, mock_logger):
+    def test_get_long_positions_success(self, position_service, mock_broker_client, make_position):
         """Test successful position retrieval."""
         # Mock broker responses
         mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 500)
+        mock_broker_client.get_position.return_value = make_position("NVDA", 500)
 
         result = position_service.get_long_positions("NVDA")
 
@@ -73,50 +158,15 @@ class TestPositionService:
 
         mock_broker_client.get_current_price.assert_called_once_with("NVDA")
         mock_broker_client.get_position.assert_called_once_with("NVDA")
-        mock_logger.log_info.assert_called()
 
-    def test_get_long_positions_with_long_calls(self, position_service, mock_broker_client, mock_logger):
+    def test_get_long_positions_with_long_calls(self, position_service, mock_broker_client, make_position, long_calls_tlt):
         """Test position retrieval with stock shares and long call options."""
         # Mock broker responses
         mock_broker_client.get_current_price.return_value = 95.50
-        mock_broker_client.get_position.return_value = MockPosition("TLT", 200)
+        mock_broker_client.get_position.return_value = make_position("TLT", 200)
         
         # Mock detailed positions with 3 long call contracts
-        long_call_1 = OptionPosition(
-            symbol="TLT",
-            quantity=1,
-            market_value=150.0,
-            average_cost=145.0,
-            unrealized_pnl=5.0,
-            position_type='long_call',
-            strike=100.0,
-            expiration=date.today() + timedelta(days=30),
-            option_type='call'
-        )
-        long_call_2 = OptionPosition(
-            symbol="TLT",
-            quantity=1,
-            market_value=140.0,
-            average_cost=135.0,
-            unrealized_pnl=5.0,
-            position_type='long_call',
-            strike=102.0,
-            expiration=date.today() + timedelta(days=30),
-            option_type='call'
-        )
-        long_call_3 = OptionPosition(
-            symbol="TLT",
-            quantity=1,
-            market_value=130.0,
-            average_cost=125.0,
-            unrealized_pnl=5.0,
-            position_type='long_call',
-            strike=104.0,
-            expiration=date.today() + timedelta(days=30),
-            option_type='call'
-        )
-        
-        mock_broker_client.get_detailed_positions.return_value = [long_call_1, long_call_2, long_call_3]
+        mock_broker_client.get_detailed_positions.return_value = long_calls_tlt
         
         result = position_service.get_long_positions("TLT")
         
@@ -132,9 +182,8 @@ class TestPositionService:
         mock_broker_client.get_current_price.assert_called_once_with("TLT")
         mock_broker_client.get_position.assert_called_once_with("TLT")
         mock_broker_client.get_detailed_positions.assert_called_once_with("TLT")
-        mock_logger.log_info.assert_called()
 
-    def test_get_long_positions_no_stock_position(self, position_service, mock_broker_client, mock_logger):
+    def test_get_long_positions_no_stock_position(self, position_service, mock_broker_client):
         """Test position retrieval when no stock position exists."""
         mock_broker_client.get_current_price.return_value = 150.0
         mock_broker_client.get_position.return_value = None
@@ -148,16 +197,16 @@ class TestPositionService:
 
     def test_get_long_positions_empty_symbol(self, position_service):
         """Test position retrieval with empty symbol."""
-        with pytest.raises(ValueError, match="Symbol cannot be empty"):
+        with pytest.raises(ValueError, match=_ERR_EMPTY_SYMBOL):
             position_service.get_long_positions("")
 
-        with pytest.raises(ValueError, match="Symbol cannot be empty"):
+        with pytest.raises(ValueError, match=_ERR_EMPTY_SYMBOL):
             position_service.get_long_positions("   ")
 
-    def test_get_long_positions_lowercase_symbol(self, position_service, mock_broker_client):
+    def test_get_long_positions_lowercase_symbol(self, position_service, mock_broker_client, make_position):
         """Test position retrieval with lowercase symbol gets converted."""
         mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 300)
+        mock_broker_client.get_position.return_value = make_position("NVDA", 300)
 
         result = position_service.get_long_positions("nvda")
 
@@ -165,40 +214,38 @@ class TestPositionService:
         mock_broker_client.get_current_price.assert_called_once_with("NVDA")
         mock_broker_client.get_position.assert_called_once_with("NVDA")
 
-    def test_get_long_positions_broker_error(self, position_service, mock_broker_client, mock_logger):
+    def test_get_long_positions_broker_error(self, position_service, mock_broker_client):
         """Test position retrieval with broker API error."""
         mock_broker_client.get_current_price.side_effect = Exception("API Error")
 
-        with pytest.raises(RuntimeError, match="Error retrieving positions for NVDA"):
+        with pytest.raises(RuntimeError, match=_ERR_NVDA):
             position_service.get_long_positions("NVDA")
 
-        mock_logger.log_error.assert_called()
-
-    def test_get_long_positions_price_error(self, position_service, mock_broker_client, mock_logger):
+    def test_get_long_positions_price_error(self, position_service, mock_broker_client):
         """Test position retrieval when price data is unavailable."""
         mock_broker_client.get_current_price.side_effect = ValueError("Price data unavailable")
 
-        with pytest.raises(RuntimeError, match="Error retrieving positions for NVDA"):
+        with pytest.raises(RuntimeError, match=_ERR_NVDA):
             position_service.get_long_positions("NVDA")
 
-    def test_calculate_available_shares_basic(self, position_service):
+    def test_calculate_available_shares_basic(self, position_service, make_position):
         """Test basic available shares calculation."""
         positions = [
-            MockPosition("NVDA", 300),
-            MockPosition("NVDA", 200)
+            make_position("NVDA", 300),
+            make_position("NVDA", 200)
         ]
 
         result = position_service.calculate_available_shares(positions)
 
         assert result == 500
 
-    def test_calculate_available_shares_mixed_quantities(self, position_service):
+    def test_calculate_available_shares_mixed_quantities(self, position_service, make_position):
         """Test available shares calculation with mixed position quantities."""
         positions = [
-            MockPosition("NVDA", 300),   # Long position
-            MockPosition("NVDA", -100),  # Short position (ignored)
-            MockPosition("NVDA", 150),   # Long position
-            MockPosition("NVDA", 0)      # Zero position (ignored)
+            make_position("NVDA", 300),   # Long position
+            make_position("NVDA", -100),  # Short position (ignored)
+            make_position("NVDA", 150),   # Long position
+            make_position("NVDA", 0)      # Zero position (ignored)
         ]
 
         result = position_service.calculate_available_shares(positions)
@@ -210,138 +257,103 @@ class TestPositionService:
         result = position_service.calculate_available_shares([])
         assert result == 0
 
-    def test_calculate_available_shares_all_negative(self, position_service):
+    def test_calculate_available_shares_all_negative(self, position_service, make_position):
         """Test available shares calculation with all negative positions."""
         positions = [
-            MockPosition("NVDA", -100),
-            MockPosition("NVDA", -200)
+            make_position("NVDA", -100),
+            make_position("NVDA", -200)
         ]
 
         result = position_service.calculate_available_shares(positions)
         assert result == 0
 
-    def test_get_existing_short_calls_placeholder(self, position_service, mock_logger):
-        """Test get_existing_short_calls returns empty list (placeholder implementation)."""
-        result = position_service.get_existing_short_calls("NVDA")
-
-        assert result == []
-        mock_logger.log_info.assert_called_with("Querying existing short calls for NVDA (not yet implemented)")
-
-    def test_validate_covered_call_orders_success(self, position_service, mock_broker_client, mock_logger):
-        """Test successful covered call order validation."""
-        # Mock position data
-        mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 500)
-
-        # Create test orders
-        orders = [
-            CoveredCallOrder("NVDA", 155.0, date.today() + timedelta(days=30), 2, 200),
-            CoveredCallOrder("NVDA", 160.0, date.today() + timedelta(days=45), 1, 100)
+    @pytest.mark.parametrize("num_short_calls", [1, 10, 1_000, 10_000])
+    def test_available_shares_large_portfolio(self, make_position, num_short_calls):
+        """Test the service's available shares against the helper for many short calls."""
+        existing_short_calls = [
+            OptionPosition(
+                symbol="NVDA", quantity=1, market_value=-500.0, average_cost=-5.0,
+                unrealized_pnl=100.0, position_type="short_call", strike=155.0 + i % 20,
+                expiration=_EXP_30, option_type="call"
+            )
+            for i in range(num_short_calls)
         ]
+        total_shares = num_short_calls * 100 + 50
+        service = PositionService(
+            _broker(150.0, make_position("NVDA", total_shares), existing_short_calls)
+        )
 
+        result = service.get_long_positions("NVDA")
+
+        assert result.available_shares == total_shares - _shares_covered(existing_short_calls)
+        assert result.available_shares == 50
+
+    @pytest.mark.parametrize(
+        "nvda_position,orders,expected_valid",
+        [
+            (500, _NVDA_ORDERS_OK, True),
+            (200, _NVDA_ORDERS_INSUFFICIENT, False),  # Needs 500 shares
+            (250, _NVDA_ORDERS_SINGLE, False),  # Below 300 minimum
+        ],
+        ids=["success", "insufficient_shares", "below_minimum"],
+        indirect=["nvda_position"],
+    )
+    def test_validate_covered_call_orders(self, position_service, nvda_position, orders,
+                                          expected_valid):
+        """Test covered call order validation against the shares held."""
         is_valid, summary = position_service.validate_covered_call_orders("NVDA", orders, 300)
 
-        assert is_valid is True
+        assert is_valid is expected_valid
         assert isinstance(summary, PositionValidationSummary)
+        assert summary.validation_passed is expected_valid
         assert summary.symbol == "NVDA"
-        assert summary.total_shares == 500
-        assert summary.available_shares == 500
-        assert summary.requested_contracts == 3
-        mock_logger.log_info.assert_called()
-
-    def test_validate_covered_call_orders_insufficient_shares(self, position_service, mock_broker_client, mock_logger):
-        """Test covered call order validation with insufficient shares."""
-        # Mock position data - only 200 shares available
-        mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 200)
+        assert summary.total_shares == nvda_position
+        assert summary.available_shares == nvda_position
+        assert summary.requested_contracts == sum(order.quantity for order in orders)
+        assert (len(summary.errors) == 0) is expected_valid
 
-        # Create orders requiring 500 shares
-        orders = [
-            CoveredCallOrder("NVDA", 155.0, date.today() + timedelta(days=30), 5, 500)
-        ]
-
-        is_valid, summary = position_service.validate_covered_call_orders("NVDA", orders, 300)
-
-        assert is_valid is False
-        assert summary.validation_passed is False
-        assert len(summary.errors) > 0
-        mock_logger.log_error.assert_called()
-
-    def test_validate_covered_call_orders_below_minimum(self, position_service, mock_broker_client, mock_logger):
-        """Test covered call order validation below minimum shares required."""
-        # Mock position data - only 250 shares available
-        mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 250)
-
-        orders = [
-            CoveredCallOrder("NVDA", 155.0, date.today() + timedelta(days=30), 1, 100)
-        ]
-
-        is_valid, summary = position_service.validate_covered_call_orders("NVDA", orders, 300)
-
-        assert is_valid is False
-        assert summary.validation_passed is False
-        mock_logger.log_error.assert_called()
-
-    def test_validate_covered_call_orders_broker_error(self, position_service, mock_broker_client, mock_logger):
+    def test_validate_covered_call_orders_broker_error(self, position_service, mock_broker_client):
         """Test covered call order validation with broker error."""
         mock_broker_client.get_current_price.side_effect = Exception("Broker API Error")
 
-        orders = [
-            CoveredCallOrder("NVDA", 155.0, date.today() + timedelta(days=30), 1, 100)
-        ]
-
-        is_valid, summary = position_service.validate_covered_call_orders("NVDA", orders, 300)
+        is_valid, summary = position_service.validate_covered_call_orders(
+            "NVDA", _NVDA_ORDERS_SINGLE, 300
+        )
 
         assert is_valid is False
         assert summary.validation_passed is False
         assert len(summary.errors) > 0
         assert "Broker API Error" in summary.errors[0]
-        mock_logger.log_error.assert_called()
 
-    def test_validate_single_covered_call_success(self, position_service, mock_broker_client, mock_logger):
-        """Test successful single covered call validation."""
-        mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 500)
-
-        result = position_service.validate_single_covered_call(
-            "NVDA", 155.0, date.today() + timedelta(days=30), 2
-        )
+    @pytest.mark.parametrize(
+        "nvda_position,expected_valid",
+        [(500, True), (50, False)],  # 2 contracts need 200 shares
+        ids=["success", "insufficient_shares"],
+        indirect=["nvda_position"],
+    )
+    def test_validate_single_covered_call(self, position_service, nvda_position, expected_valid):
+        """Test single covered call validation against the shares held."""
+        result = position_service.validate_single_covered_call("NVDA", 155.0, _EXP_30, 2)
 
         assert isinstance(result, ValidationResult)
-        assert result.is_valid is True
-        assert result.error_message is None
-        mock_logger.log_info.assert_called()
-
-    def test_validate_single_covered_call_insufficient_shares(self, position_service, mock_broker_client, mock_logger):
-        """Test single covered call validation with insufficient shares."""
-        mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 50)  # Only 50 shares
-
-        result = position_service.validate_single_covered_call(
-            "NVDA", 155.0, date.today() + timedelta(days=30), 2  # Need 200 shares
-        )
-
-        assert result.is_valid is False
-        assert result.error_message is not None
-        mock_logger.log_error.assert_called()
+        assert result.is_valid is expected_valid
+        assert (result.error_message is None) is expected_valid
 
-    def test_validate_single_covered_call_error(self, position_service, mock_broker_client, mock_logger):
+    def test_validate_single_covered_call_error(self, position_service, mock_broker_client):
         """Test single covered call validation with error."""
         mock_broker_client.get_current_price.side_effect = Exception("API Error")
 
         result = position_service.validate_single_covered_call(
-            "NVDA", 155.0, date.today() + timedelta(days=30), 1
+            "NVDA", 155.0, _EXP_30, 1
         )
 
         assert result.is_valid is False
         assert "API Error" in result.error_message
-        mock_logger.log_error.assert_called()
 
-    def test_get_position_validation_summary_success(self, position_service, mock_broker_client, mock_logger):
+    def test_get_position_validation_summary_success(self, position_service, mock_broker_client, make_position):
         """Test successful position validation summary."""
         mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 500)
+        mock_broker_client.get_position.return_value = make_position("NVDA", 500)
 
         summary = position_service.get_position_validation_summary("NVDA")
 
@@ -352,12 +364,11 @@ class TestPositionService:
         assert summary.max_contracts_allowed == 5  # 500 shares / 100
         assert summary.validation_passed is True
         assert len(summary.errors) == 0
-        mock_logger.log_info.assert_called()
 
-    def test_get_position_validation_summary_insufficient_shares(self, position_service, mock_broker_client, mock_logger):
+    def test_get_position_validation_summary_insufficient_shares(self, position_service, mock_broker_client, make_position):
         """Test position validation summary with insufficient shares."""
         mock_broker_client.get_current_price.return_value = 150.0
-        mock_broker_client.get_position.return_value = MockPosition("NVDA", 50)  # Less than 100 shares
+        mock_broker_client.get_position.return_value = make_position("NVDA", 50)  # Less than 100 shares
 
         summary = position_service.get_position_validation_summary("NVDA")
 
@@ -366,7 +377,7 @@ class TestPositionService:
         assert len(summary.errors) > 0
         assert "Insufficient shares" in summary.errors[0]
 
-    def test_get_position_validation_summary_error(self, position_service, mock_broker_client, mock_logger):
+    def test_get_position_validation_summary_error(self, position_service, mock_broker_client):
         """Test position validation summary with error."""
         mock_broker_client.get_current_price.side_effect = Exception("API Error")
 
@@ -377,84 +388,79 @@ class TestPositionService:
         assert summary.available_shares == 0
         assert len(summary.errors) > 0
         assert "API Error" in summary.errors[0]
-        mock_logger.log_error.assert_called()
 
 
-class TestPositionSummaryCalculation:
-    """Test cases for position summary calculations with various holding combinations."""
-
-    @pytest.fixture
-    def mock_broker_client(self):
-        """Create a mock broker client."""
-        client = Mock()
-        client.get_current_price = Mock()
-        client.get_position = Mock()
-        return client
+class TestLogging:
+    """Test cases for PositionService logging."""
 
-    @pytest.fixture
-    def position_service(self, mock_broker_client):
-        """Create a PositionService instance."""
-        return PositionService(mock_broker_client)
+    def test_get_existing_short_calls_placeholder(self, position_service, mock_logger):
+        """Test get_existing_short_calls returns empty list (placeholder implementation)."""
+        result = position_service.get_existing_short_calls("NVDA")
 
-    def test_position_summary_with_large_position(self, position_service, mock_broker_client):
-        """Test position summary calculation with large stock position."""
-        mock_broker_client.get_current_price.return_value = 200.0
-        mock_broker_client.get_position.return_value = MockPosition("TSLA", 1000)
+        assert result == []
+        mock_logger.log_info.assert_called_with("Querying existing short calls for NVDA (not yet implemented)")
 
-        result = position_service.get_long_positions("TSLA")
+    @pytest.mark.parametrize("operation", list(_OPERATIONS.values()), ids=list(_OPERATIONS))
+    def test_logger_is_invoked_on_success(self, position_service, mock_broker_client, mock_logger,
+                                          make_position, operation):
+        """Test that successful position queries and validations log their progress."""
+        mock_broker_client.get_current_price.return_value = 150.0
+        mock_broker_client.get_position.return_value = make_position("NVDA", 500)
 
-        assert result.symbol == "TSLA"
-        assert result.total_shares == 1000
-        assert result.available_shares == 1000
-        assert result.current_price == 200.0
+        operation(position_service)
 
-    def test_position_summary_with_small_position(self, position_service, mock_broker_client):
-        """Test position summary calculation with small stock position."""
-        mock_broker_client.get_current_price.return_value = 50.0
-        mock_broker_client.get_position.return_value = MockPosition("F", 75)
+        assert mock_logger.log_info.call_count >= 1
 
-        result = position_service.get_long_positions("F")
+    @pytest.mark.parametrize("operation", list(_OPERATIONS.values()), ids=list(_OPERATIONS))
+    def test_logger_is_invoked_on_error(self, position_service, mock_broker_client, mock_logger,
+                                        operation):
+        """Test that broker failures are logged as errors by every operation."""
+        mock_broker_client.get_current_price.side_effect = Exception("API Error")
 
-        assert result.symbol == "F"
-        assert result.total_shares == 75
-        assert result.available_shares == 75
-        assert result.current_price == 50.0
+        with contextlib.suppress(RuntimeError):
+            operation(position_service)
 
-    def test_position_summary_with_zero_position(self, position_service, mock_broker_client):
-        """Test position summary calculation with zero stock position."""
-        mock_broker_client.get_current_price.return_value = 100.0
-        mock_broker_client.get_position.return_value = MockPosition("AAPL", 0)
+        assert mock_logger.log_error.call_count >= 1
 
-        result = position_service.get_long_positions("AAPL")
+    @pytest.mark.parametrize(
+        "operation",
+        [_OPERATIONS["validate_covered_call_orders"], _OPERATIONS["validate_single_covered_call"]],
+        ids=["validate_covered_call_orders", "validate_single_covered_call"],
+    )
+    def test_logger_is_invoked_on_failed_validation(self, position_service, mock_broker_client,
+                                                    mock_logger, make_position, operation):
+        """Test that validations failing on insufficient shares are logged as errors."""
+        mock_broker_client.get_current_price.return_value = 150.0
+        mock_broker_client.get_position.return_value = make_position("NVDA", 50)
 
-        assert result.symbol == "AAPL"
-        assert result.total_shares == 0
-        assert result.available_shares == 0
-        assert result.current_price == 100.0
+        operation(position_service)
 
-    def test_position_summary_high_price_stock(self, position_service, mock_broker_client):
-        """Test position summary with high-priced stock."""
-        mock_broker_client.get_current_price.return_value = 1500.0
-        mock_broker_client.get_position.return_value = MockPosition("BRK.A", 10)
+        assert mock_logger.log_error.call_count >= 1
 
-        result = position_service.get_long_positions("BRK.A")
 
-        assert result.symbol == "BRK.A"
-        assert result.total_shares == 10
-        assert result.available_shares == 10
-        assert result.current_price == 1500.0
+class TestPositionSummaryCalculation:
+    """Test cases for position summary calculations with various holding combinations."""
 
-    def test_position_summary_low_price_stock(self, position_service, mock_broker_client):
-        """Test position summary with low-priced stock."""
-        mock_broker_client.get_current_price.return_value = 2.50
-        mock_broker_client.get_position.return_value = MockPosition("SIRI", 2000)
+    @pytest.mark.parametrize(
+        "symbol,quantity,price",
+        [
+            ("TSLA", 1000, 200.0),  # Large stock position
+            ("F", 75, 50.0),  # Small stock position
+            ("AAPL", 0, 100.0),  # Zero stock position
+            ("BRK.A", 10, 1500.0),  # High-priced stock
+            ("SIRI", 2000, 2.50),  # Low-priced stock
+        ],
+    )
+    def test_position_summary(self, make_position, symbol, quantity, price):
+        """Test position summary calculation across position sizes and price levels."""
+        service = PositionService(_broker(price, make_position(symbol, quantity)))
 
-        result = position_service.get_long_positions("SIRI")
+        result = service.get_long_positions(symbol)
 
-        assert result.symbol == "SIRI"
-        assert result.total_shares == 2000
-        assert result.available_shares == 2000
-        assert result.current_price == 2.50
+        assert result.symbol == symbol
+        assert result.total_shares == quantity
+        assert result.available_shares == quantity
+        assert result.current_price == price
 
 
 class TestAvailableSharesCalculation:
@@ -462,151 +468,59 @@ class TestAvailableSharesCalculation:
 
     @pytest.fixture
     def position_service(self):
-        """Create a PositionService instance."""
-        return PositionService(Mock())
-
-    def test_available_shares_with_existing_short_calls(self, position_service):
+        """Return the shared stub PositionService, checking it was never called."""
+        yield _STUB_SERVICE
+        assert _STUB_SERVICE.broker_client.mock_calls == []
+
+    @pytest.mark.parametrize(
+        "total_shares,short_call_contracts,expected_available",
+        [
+            (500, [2], 300),  # 500 - 200
+            (800, [1, 2], 500),  # 800 - 300 (1*100 + 2*100)
+            (400, [6], 0),  # max(0, 400 - 600)
+            (500, [], 500),  # All shares available
+        ],
+        ids=["single_short_call", "multiple_short_calls", "more_calls_than_shares", "no_short_calls"],
+    )
+    def test_available_shares(self, position_service, total_shares, short_call_contracts,
+                              expected_available):
         """Test available shares calculation accounting for existing short calls."""
-        # Mock position summary with existing short calls
         existing_short_calls = [
             OptionPosition(
-                symbol="NVDA",
-                quantity=2,  # 2 contracts = 200 shares covered
-                market_value=-1000.0,
-                average_cost=-5.0,
-                unrealized_pnl=200.0,
-                position_type="short_call",
-                strike=160.0,
-                expiration=date.today() + timedelta(days=30),
-                option_type="call"
+                symbol="NVDA", quantity=contracts, market_value=-500.0 * contracts,
+                average_cost=-5.0, unrealized_pnl=100.0 * contracts, position_type="short_call",
+                strike=155.0, expiration=_EXP_30, option_type="call"
             )
+            for contracts in short_call_contracts
         ]
 
-        # Calculate available shares manually (since this is tested in isolation)
-        total_shares = 500
-        shares_covered_by_calls = sum(
-            option.quantity * 100 for option in existing_short_calls 
-            if option.option_type == 'call' and option.position_type == 'short_call'
-        )
-        expected_available = max(0, total_shares - shares_covered_by_calls)
+        available = max(0, total_shares - _shares_covered(existing_short_calls))
 
-        assert expected_available == 300  # 500 - 200
-
-    def test_available_shares_multiple_short_calls(self, position_service):
-        """Test available shares calculation with multiple existing short calls."""
-        existing_short_calls = [
-            OptionPosition(
-                symbol="NVDA", quantity=1, market_value=-500.0, average_cost=-5.0,
-                unrealized_pnl=100.0, position_type="short_call", strike=155.0,
-                expiration=date.today() + timedelta(days=15), option_type="call"
-            ),
-            OptionPosition(
-                symbol="NVDA", quantity=2, market_value=-1000.0, average_cost=-5.0,
-                unrealized_pnl=200.0, position_type="short_call", strike=160.0,
-                expiration=date.today() + timedelta(days=30), option_type="call"
-            )
-        ]
-
-        total_shares = 800
-        shares_covered_by_calls = sum(
-            option.quantity * 100 for option in existing_short_calls 
-            if option.option_type == 'call' and option.position_type == 'short_call'
-        )
-        expected_available = max(0, total_shares - shares_covered_by_calls)
-
-        assert expected_available == 500  # 800 - 300 (1*100 + 2*100)
-
-    def test_available_shares_more_calls_than_shares(self, position_service):
-        """Test available shares calculation when short calls exceed total shares."""
-        existing_short_calls = [
-            OptionPosition(
-                symbol="NVDA", quantity=6, market_value=-3000.0, average_cost=-5.0,
-                unrealized_pnl=600.0, position_type="short_call", strike=155.0,
-                expiration=date.today() + timedelta(days=15), option_type="call"
-            )
-        ]
-
-        total_shares = 400
-        shares_covered_by_calls = sum(
-            option.quantity * 100 for option in existing_short_calls 
-            if option.option_type == 'call' and option.position_type == 'short_call'
-        )
-        expected_available = max(0, total_shares - shares_covered_by_calls)
-
-        assert expected_available == 0  # max(0, 400 - 600)
-
-    def test_available_shares_no_short_calls(self, position_service):
-        """Test available shares calculation with no existing short calls."""
-        total_shares = 500
-        existing_short_calls = []
-        
-        shares_covered_by_calls = sum(
-            option.quantity * 100 for option in existing_short_calls 
-            if option.option_type == 'call' and option.position_type == 'short_call'
-        )
-        expected_available = max(0, total_shares - shares_covered_by_calls)
-
-        assert expected_available == 500  # All shares available
+        assert available == expected_available
 
 
+@pytest.mark.usefixtures("silent_logger")
 class TestErrorHandling:
     """Test cases for error handling with edge cases and API failures."""
 
-    @pytest.fixture
-    def mock_broker_client(self):
-        """Create a mock broker client."""
-        return Mock()
-
-    @pytest.fixture
-    def mock_logger(self):
-        """Create a mock logger."""
-        logger = Mock()
-        logger.info = Mock()
-        logger.error = Mock()
-        logger.log_info = Mock()
-        logger.log_error = Mock()
-        return logger
-
-    @pytest.fixture
-    def position_service(self, mock_broker_client, mock_logger):
-        """Create a PositionService instance."""
-        return PositionService(mock_broker_client, mock_logger)
-
-    def test_api_timeout_error(self, position_service, mock_broker_client, mock_logger):
-        """Test handling of API timeout errors."""
-        mock_broker_client.get_current_price.side_effect = TimeoutError("Request timeout")
-
-        with pytest.raises(RuntimeError, match="Error retrieving positions for NVDA"):
-            position_service.get_long_positions("NVDA")
-
-        mock_logger.log_error.assert_called()
-
-    def test_api_connection_error(self, position_service, mock_broker_client, mock_logger):
-        """Test handling of API connection errors."""
-        mock_broker_client.get_current_price.side_effect = ConnectionError("Connection failed")
-
-        with pytest.raises(RuntimeError, match="Error retrieving positions for NVDA"):
-            position_service.get_long_positions("NVDA")
-
-        mock_logger.log_error.assert_called()
-
-    def test_api_authentication_error(self, position_service, mock_broker_client, mock_logger):
-        """Test handling of API authentication errors."""
-        mock_broker_client.get_current_price.side_effect = Exception("Authentication failed")
-
-        with pytest.raises(RuntimeError, match="Error retrieving positions for NVDA"):
-            position_service.get_long_positions("NVDA")
-
-        mock_logger.log_error.assert_called()
-
-    def test_invalid_symbol_error(self, position_service, mock_broker_client, mock_logger):
-        """Test handling of invalid symbol errors."""
-        mock_broker_client.get_current_price.side_effect = ValueError("Invalid symbol")
-
-        with pytest.raises(RuntimeError, match="Error retrieving positions for INVALID"):
-            position_service.get_long_positions("INVALID")
-
-        mock_logger.log_error.assert_called()
+    @pytest.mark.parametrize(
+        "error,symbol,message",
+        [
+            (TimeoutError("Request timeout"), "NVDA", _ERR_NVDA),
+            (ConnectionError("Connection failed"), "NVDA", _ERR_NVDA),
+            (Exception("Authentication failed"), "NVDA", _ERR_NVDA),
+            (ValueError("Invalid symbol"), "INVALID", _ERR_INVALID),
+            (OSError("Network is unreachable"), "NVDA", _ERR_NVDA),
+        ],
+        ids=["timeout", "connection", "authentication", "invalid_symbol", "network"],
+    )
+    def test_api_errors_wrapped(self, position_service, mock_broker_client,
+                                error, symbol, message):
+        """Test that broker API errors of any type are wrapped in RuntimeError."""
+        mock_broker_client.get_current_price.side_effect = error
+
+        with pytest.raises(RuntimeError, match=message):
+            position_service.get_long_positions(symbol)
 
     def test_empty_response_handling(self, position_service, mock_broker_client):
         """Test handling of empty API responses."""
@@ -619,42 +533,29 @@ class TestErrorHandling:
         assert result.available_shares == 0
         assert result.current_price == 100.0
 
-    def test_malformed_response_handling(self, position_service, mock_broker_client, mock_logger):
+    def test_malformed_response_handling(self, position_service, mock_broker_client):
         """Test handling of malformed API responses."""
         mock_broker_client.get_current_price.return_value = "invalid_price"  # Should be float
 
         with pytest.raises(RuntimeError):
             position_service.get_long_positions("NVDA")
 
-        mock_logger.log_error.assert_called()
-
-    def test_partial_api_failure(self, position_service, mock_broker_client, mock_logger):
+    def test_partial_api_failure(self, position_service, mock_broker_client):
         """Test handling when some API calls succeed and others fail."""
         mock_broker_client.get_current_price.return_value = 150.0  # Success
         mock_broker_client.get_position.side_effect = Exception("Position API failed")  # Failure
 
-        with pytest.raises(RuntimeError, match="Error retrieving positions for NVDA"):
+        with pytest.raises(RuntimeError, match=_ERR_NVDA):
             position_service.get_long_positions("NVDA")
 
-        mock_logger.log_error.assert_called()
-
-    def test_validation_with_api_failure(self, position_service, mock_broker_client, mock_logger):
+    def test_validation_with_api_failure(self, position_service, mock_broker_client):
         """Test validation methods handle API failures gracefully."""
         mock_broker_client.get_current_price.side_effect = Exception("API Error")
 
-        orders = [CoveredCallOrder("NVDA", 155.0, date.today() + timedelta(days=30), 1, 100)]
-        is_valid, summary = position_service.validate_covered_call_orders("NVDA", orders)
+        is_valid, summary = position_service.validate_covered_call_orders(
+            "NVDA", _NVDA_ORDERS_SINGLE
+        )
 
         assert is_valid is False
         assert summary.validation_passed is False
         assert len(summary.errors) > 0
-        mock_logger.log_error.assert_called()
-
-    def test_network_interruption_handling(self, position_service, mock_broker_client, mock_logger):
-        """Test handling of network interruption during API calls."""
-        mock_broker_client.get_current_price.side_effect = OSError("Network is unreachable")
-
-        with pytest.raises(RuntimeError, match="Error retrieving positions for NVDA"):
-            position_service.get_long_positions("NVDA")
-
-        mock_logger.log_error.assert_called()
\ No newline at end of file
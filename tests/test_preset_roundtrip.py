@@ -1,32 +1,51 @@
 """Property-based tests for preset round-trip consistency."""
 
 import pytest
-import tempfile
-from pathlib import Path
-from hypothesis import given, strategies as st, settings
+from unittest.mock import patch
+from hypothesis import given, strategies as st
 from screener.config import ConfigManager
 
 
+def _finite_floats(min_value, max_value):
+    return st.floats(min_value=min_value, max_value=max_value, allow_nan=False, allow_infinity=False)
+
+
+@st.composite
+def _ordered_range(draw, min_value, lo_max, max_value):
+    """Draw a (low, high) pair with low <= high in one step."""
+    lo = draw(_finite_floats(min_value, lo_max))
+    hi = draw(_finite_floats(lo, max_value))
+    return lo, hi
+
+
+@st.composite
+def _filters(draw):
+    """Filter dictionaries whose min/max pairs are always ordered."""
+    price_min, price_max = draw(_ordered_range(1.0, 500.0, 1000.0))
+    rsi_min, rsi_max = draw(_ordered_range(0.0, 100.0, 100.0))
+    beta_min, beta_max = draw(_ordered_range(0.0, 3.0, 5.0))
+    return {
+        'min_market_cap': draw(_finite_floats(1e6, 1e12)),
+        'min_volume': draw(st.integers(min_value=100000, max_value=100000000)),
+        'price_min': price_min,
+        'price_max': price_max,
+        'rsi_min': rsi_min,
+        'rsi_max': rsi_max,
+        'beta_min': beta_min,
+        'beta_max': beta_max,
+    }
+
+
 # Strategy for generating filter dictionaries
-filter_strategy = st.fixed_dictionaries({
-    'min_market_cap': st.floats(min_value=1e6, max_value=1e12, allow_nan=False, allow_infinity=False),
-    'min_volume': st.integers(min_value=100000, max_value=100000000),
-    'price_min': st.floats(min_value=1.0, max_value=500.0, allow_nan=False, allow_infinity=False),
-    'price_max': st.floats(min_value=1.0, max_value=1000.0, allow_nan=False, allow_infinity=False),
-    'rsi_min': st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-    'rsi_max': st.floats(min_value=0.0, max_value=100.0, allow_nan=False, allow_infinity=False),
-    'beta_min': st.floats(min_value=0.0, max_value=3.0, allow_nan=False, allow_infinity=False),
-    'beta_max': st.floats(min_value=0.0, max_value=5.0, allow_nan=False, allow_infinity=False),
-})
-
-
-@settings(max_examples=100)
+filter_strategy = _filters()
+
+
 @given(
     preset_name=st.text(min_size=1, max_size=50, alphabet=st.characters(blacklist_categories=('Cs', 'Cc'))),
     strategy_name=st.sampled_from(['PCS', 'CoveredCall', 'IronCondor', 'Collar']),
     filters=filter_strategy
 )
-def test_preset_roundtrip_consistency(preset_name, strategy_name, filters):
+def test_preset_roundtrip_consistency(fresh_config, preset_name, strategy_name, filters):
     """
     Feature: strategy-stock-screener, Property 23: Preset Round-Trip Consistency
     
@@ -35,72 +54,112 @@ def test_preset_roundtrip_consistency(preset_name, strategy_name, filters):
     
     Validates: Requirements 7.2, 7.3
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.json"
-        presets_path = Path(tmpdir) / "presets.json"
-        
-        config = ConfigManager(str(config_path), str(presets_path))
-        
+    with fresh_config() as config:
         # Save preset
         config.save_preset(preset_name, strategy_name, filters)
         
         # Load preset
         loaded_filters = config.load_preset(preset_name, strategy_name)
-        
-        # Verify round-trip consistency
-        assert loaded_filters is not None, f"Preset '{preset_name}' for strategy '{strategy_name}' should exist"
-        assert loaded_filters == filters, f"Loaded filters should match saved filters"
+    
+    # Verify round-trip consistency
+    assert loaded_filters is not None, f"Preset '{preset_name}' for strategy '{strategy_name}' should exist"
+    assert loaded_filters == filters, f"Loaded filters should match saved filters"
 
 
-@settings(max_examples=100)
 @given(
     preset_name=st.text(min_size=1, max_size=50, alphabet=st.characters(blacklist_categories=('Cs', 'Cc'))),
     strategy_name=st.sampled_from(['PCS', 'CoveredCall', 'IronCondor', 'Collar']),
     filters=filter_strategy
 )
-def test_preset_persistence_across_instances(preset_name, strategy_name, filters):
+def test_preset_persistence_across_instances(fresh_config, preset_name, strategy_name, filters):
     """
     Test that presets persist across ConfigManager instances.
     
     Validates: Requirements 7.2, 7.3
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.json"
-        presets_path = Path(tmpdir) / "presets.json"
-        
+    with fresh_config() as config1:
         # Save preset with first instance
-        config1 = ConfigManager(str(config_path), str(presets_path))
         config1.save_preset(preset_name, strategy_name, filters)
         
         # Load preset with second instance
-        config2 = ConfigManager(str(config_path), str(presets_path))
+        config2 = ConfigManager(str(config1.config_path), str(config1.presets_path))
         loaded_filters = config2.load_preset(preset_name, strategy_name)
-        
-        # Verify persistence
-        assert loaded_filters is not None
-        assert loaded_filters == filters
+    
+    # Verify persistence
+    assert loaded_filters is not None
+    assert loaded_filters == filters
 
 
-@settings(max_examples=100)
 @given(
     filters=filter_strategy
 )
-def test_preset_with_special_characters_in_name(filters):
+def test_preset_with_special_characters_in_name(fresh_config, filters):
     """
     Test that presets work with various valid preset names.
     
     Validates: Requirements 7.2, 7.3
     """
-    with tempfile.TemporaryDirectory() as tmpdir:
-        config_path = Path(tmpdir) / "config.json"
-        presets_path = Path(tmpdir) / "presets.json"
-        
-        config = ConfigManager(str(config_path), str(presets_path))
-        
+    with fresh_config() as config:
         # Test with various preset names
         test_names = ["aggressive", "conservative-v2", "test_preset", "preset.1"]
         
-        for preset_name in test_names:
-            config.save_preset(preset_name, "PCS", filters)
-            loaded = config.load_preset(preset_name, "PCS")
-            assert loaded == filters, f"Round-trip failed for preset name: {preset_name}"
+        with config.batched():
+            for preset_name in test_names:
+                config.save_preset(preset_name, "PCS", filters)
+                loaded = config.load_preset(preset_name, "PCS")
+                assert loaded == filters, f"Round-trip failed for preset name: {preset_name}"
+
+
+def test_batched_presets_written_once_on_exit(tmp_path):
+    """Presets saved inside batched() reach disk only when the block exits."""
+    presets_path = tmp_path / "presets.json"
+    config = ConfigManager(str(tmp_path / "config.json"), str(presets_path))
+
+    with config.batched():
+        config.save_preset("aggressive", "PCS", {"rsi_min": 40})
+        config.save_preset("conservative", "PCS", {"rsi_min": 50})
+        assert not presets_path.exists()
+
+    reloaded = ConfigManager(str(tmp_path / "config.json"), str(presets_path))
+    assert reloaded.list_presets("PCS") == ["aggressive", "conservative"]
+
+
+def test_autosave_disabled_defers_presets_until_save(tmp_path):
+    """With autosave off, presets stay in memory until save() is called."""
+    presets_path = tmp_path / "presets.json"
+    config = ConfigManager(str(tmp_path / "config.json"), str(presets_path), autosave=False)
+
+    config.save_preset("aggressive", "PCS", {"rsi_min": 40})
+    assert config.load_preset("aggressive", "PCS") == {"rsi_min": 40}
+    assert not presets_path.exists()
+
+    config.save()
+
+    reloaded = ConfigManager(str(tmp_path / "config.json"), str(presets_path))
+    assert reloaded.load_preset("aggressive", "PCS") == {"rsi_min": 40}
+
+
+def test_batched_keeps_block_exception_when_flush_fails(tmp_path):
+    """A failing flush on exit does not replace the exception raised in the block."""
+    presets_path = tmp_path / "presets.json"
+    config = ConfigManager(str(tmp_path / "config.json"), str(presets_path))
+
+    with patch("screener.config.manager._write_json", side_effect=IOError("disk full")):
+        with pytest.raises(ValueError, match="block failed"):
+            with config.batched():
+                config.save_preset("aggressive", "PCS", {"rsi_min": 40})
+                raise ValueError("block failed")
+
+    assert config._autosave
+
+
+def test_failed_write_removes_temporary_file(tmp_path):
+    """A write that fails part way leaves neither the target nor its .tmp file."""
+    presets_path = tmp_path / "presets.json"
+    config = ConfigManager(str(tmp_path / "config.json"), str(presets_path))
+
+    with patch("screener.config.manager._dumps", side_effect=TypeError("not serializable")):
+        with pytest.raises(TypeError):
+            config.save_preset("aggressive", "PCS", {"rsi_min": 40})
+
+    assert list(tmp_path.iterdir()) == []
@@ -9,7 +9,8 @@ the results display should update automatically without requiring manual refresh
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
+import numpy as np
 import pandas as pd
 from screener.core.engine import ScreeningEngine
 from screener.core.models import StockData
@@ -19,7 +20,78 @@ from screener.core.models import StockData
 # we test the underlying logic that would trigger updates
 
 
-@settings(max_examples=100)
+class MockStrategy:
+    """Minimal strategy; apply_filters only needs something strategy-shaped."""
+
+    @property
+    def name(self):
+        return "Mock"
+    
+    @property
+    def default_filters(self):
+        return {}
+    
+    def get_finviz_filters(self, params):
+        return {}
+    
+    def score_stock(self, stock_data):
+        return 50.0
+    
+    def score_vectorized(self, df):
+        return np.full(len(df), 50.0)
+    
+    def analyze_stock(self, stock_data):
+        return None
+
+
+@pytest.fixture(scope="module")
+def engine():
+    """Screening engine shared by the module's tests, with strategies discovered up front."""
+    engine = ScreeningEngine()
+    engine.get_available_strategies()
+    return engine
+
+
+@pytest.fixture(scope="module")
+def strategy():
+    """Mock strategy shared by the module's tests."""
+    return MockStrategy()
+
+
+@pytest.fixture(scope="module")
+def sample_stocks_df():
+    """Twenty stocks with increasing price, volume and market cap.
+
+    apply_filters copies its input, so tests can share this frame as is.
+    """
+    i = np.arange(20)
+    stocks_data = {
+        'ticker': [f'STOCK{k}' for k in range(20)],
+        'company_name': [f'Company {k}' for k in range(20)],
+        'price': 50 + i * 10,
+        'volume': 1_000_000,
+        'avg_volume': 1_000_000 + i * 100_000,
+        'market_cap': 2e9 + i * 1e9,
+        'rsi': 50,
+        'sma20': 50,
+        'sma50': 50,
+        'sma200': 50,
+        'beta': 1.0,
+        'implied_volatility': 0.3,
+        'iv_rank': 50,
+        'option_volume': 10000,
+        'sector': 'Technology',
+        'industry': 'Software',
+        'earnings_date': None,
+        'earnings_days_away': 30,
+        'perf_week': 0,
+        'perf_month': 0,
+        'perf_quarter': 0,
+    }
+    
+    return pd.DataFrame(stocks_data)
+
+
 @given(
     min_market_cap=st.floats(min_value=1e9, max_value=1e12),
     min_volume=st.integers(min_value=500_000, max_value=5_000_000),
@@ -27,7 +99,7 @@ from screener.core.models import StockData
     price_max=st.floats(min_value=100, max_value=500),
 )
 def test_filter_changes_produce_different_results(
-    min_market_cap, min_volume, price_min, price_max
+    sample_stocks_df, engine, strategy, min_market_cap, min_volume, price_min, price_max
 ):
     """
     Property 1: Reactive UI Updates
@@ -38,35 +110,6 @@ def test_filter_changes_produce_different_results(
     This tests the underlying logic that Marimo would use to reactively
     update the UI when parameters change.
     """
-    # Create sample stock data
-    stocks_data = []
-    for i in range(20):
-        stocks_data.append({
-            'ticker': f'STOCK{i}',
-            'company_name': f'Company {i}',
-            'price': 50 + i * 10,
-            'volume': 1_000_000,
-            'avg_volume': 1_000_000 + i * 100_000,
-            'market_cap': 2e9 + i * 1e9,
-            'rsi': 50,
-            'sma20': 50,
-            'sma50': 50,
-            'sma200': 50,
-            'beta': 1.0,
-            'implied_volatility': 0.3,
-            'iv_rank': 50,
-            'option_volume': 10000,
-            'sector': 'Technology',
-            'industry': 'Software',
-            'earnings_date': None,
-            'earnings_days_away': 30,
-            'perf_week': 0,
-            'perf_month': 0,
-            'perf_quarter': 0,
-        })
-    
-    stocks_df = pd.DataFrame(stocks_data)
-    
     # Create two different filter sets
     filters1 = {
         'min_market_cap': min_market_cap,
@@ -82,33 +125,9 @@ def test_filter_changes_produce_different_results(
         'price_max': price_max * 0.8,
     }
     
-    # Create engine and apply filters
-    engine = ScreeningEngine()
-    
-    # Mock strategy for filtering
-    class MockStrategy:
-        @property
-        def name(self):
-            return "Mock"
-        
-        @property
-        def default_filters(self):
-            return {}
-        
-        def get_finviz_filters(self, params):
-            return {}
-        
-        def score_stock(self, stock_data):
-            return 50.0
-        
-        def analyze_stock(self, stock_data):
-            return None
-    
-    strategy = MockStrategy()
-    
     # Apply both filter sets
-    result1 = engine.apply_filters(stocks_df.copy(), filters1, strategy)
-    result2 = engine.apply_filters(stocks_df.copy(), filters2, strategy)
+    result1 = engine.apply_filters(sample_stocks_df, filters1, strategy)
+    result2 = engine.apply_filters(sample_stocks_df, filters2, strategy)
     
     # The results should be different when filters are different
     # (unless all stocks pass both filters, which is unlikely with random values)
@@ -120,15 +139,50 @@ def test_filter_changes_produce_different_results(
     assert len(result2) <= len(result1)
 
 
-def test_strategy_change_loads_new_filters():
+def test_screen_stocks_prefers_vectorized_scoring(sample_stocks_df, monkeypatch):
+    """
+    Test that screening scores the whole frame through score_vectorized when offered.
+    """
+    class VectorOnlyStrategy(MockStrategy):
+        def score_stock(self, stock_data):
+            raise AssertionError("per-row scoring should be skipped")
+    
+    engine = ScreeningEngine()
+    monkeypatch.setattr(engine, "load_strategy", lambda name: VectorOnlyStrategy())
+    
+    results = engine.screen_stocks("Mock", {}, sample_stocks_df)
+    
+    assert len(results.stocks) == len(sample_stocks_df)
+    assert (results.stocks['strategy_score'] == 50.0).all()
+
+
+@pytest.mark.parametrize("score_vectorized", [
+    lambda df: 1 / 0,
+    lambda df: np.full(len(df) - 1, 90.0),
+], ids=["raises", "wrong_length"])
+def test_screen_stocks_falls_back_when_vectorized_scoring_fails(sample_stocks_df, monkeypatch, score_vectorized):
+    """
+    Test that a failing or malformed score_vectorized falls back to per-row scoring.
+    """
+    strategy = MockStrategy()
+    strategy.score_vectorized = score_vectorized
+    
+    engine = ScreeningEngine()
+    monkeypatch.setattr(engine, "load_strategy", lambda name: strategy)
+    
+    results = engine.screen_stocks("Mock", {}, sample_stocks_df)
+    
+    assert len(results.stocks) == len(sample_stocks_df)
+    assert (results.stocks['strategy_score'] == 50.0).all()
+
+
+def test_strategy_change_loads_new_filters(engine):
     """
     Test that changing strategy loads new default filters.
     
     This simulates the reactive behavior where selecting a different
     strategy should load that strategy's default filters.
     """
-    engine = ScreeningEngine()
-    
     # Get available strategies
     strategies = engine.get_available_strategies()
     
@@ -153,14 +207,13 @@ def test_strategy_change_loads_new_filters():
         # At minimum, they should both be valid dictionaries
 
 
-def test_filter_panel_reflects_strategy_defaults():
+def test_filter_panel_reflects_strategy_defaults(engine):
     """
     Test that filter panel values match strategy defaults.
     
     This ensures that when a strategy is selected, the filter panel
     is populated with the correct default values.
     """
-    engine = ScreeningEngine()
     strategies = engine.get_available_strategies()
     
     if len(strategies) < 1:
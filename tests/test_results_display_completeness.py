@@ -9,13 +9,41 @@ key metrics (price, volume, market cap), and strategy-specific scores for all st
 """
 
 import pytest
-from hypothesis import given, strategies as st, settings
+from hypothesis import given, strategies as st
+import numpy as np
 import pandas as pd
 from datetime import datetime
+from screener.core.engine import ScreeningEngine
 from screener.core.models import ScreenerResults
 
+# Static result tables shared by the display tests; treat them as read-only.
+_TWO_STOCKS_DF = pd.DataFrame([
+    {
+        'ticker': 'AAPL',
+        'company_name': 'Apple Inc.',
+        'price': 150.25,
+        'volume': 50_000_000,
+        'market_cap': 2.5e12,
+        'rsi': 55.5,
+        'iv_rank': 45.0,
+        'strategy_score': 75.5,
+    },
+    {
+        'ticker': 'MSFT',
+        'company_name': 'Microsoft Corporation',
+        'price': 350.75,
+        'volume': 30_000_000,
+        'market_cap': 2.8e12,
+        'rsi': 60.0,
+        'iv_rank': 50.0,
+        'strategy_score': 80.0,
+    },
+])
+_EMPTY_STOCKS_DF = pd.DataFrame(columns=[
+    'ticker', 'company_name', 'price', 'volume', 'market_cap', 'strategy_score'
+])
+
 
-@settings(max_examples=100)
 @given(
     num_stocks=st.integers(min_value=1, max_value=50),
     has_scores=st.booleans(),
@@ -29,65 +57,53 @@ def test_results_contain_required_columns(num_stocks, has_scores):
     - key metrics (price, volume, market_cap)
     - strategy_score (if scoring was performed)
     """
-    # Create sample screening results
-    stocks_data = []
-    for i in range(num_stocks):
-        stock = {
-            'ticker': f'STOCK{i}',
-            'company_name': f'Company {i}',
-            'price': 50.0 + i,
-            'volume': 1_000_000 + i * 10000,
-            'avg_volume': 1_000_000 + i * 10000,
-            'market_cap': 2e9 + i * 1e8,
-            'rsi': 50.0,
-            'sma20': 50.0,
-            'sma50': 50.0,
-            'sma200': 50.0,
-            'beta': 1.0,
-            'implied_volatility': 0.3,
-            'iv_rank': 50.0,
-            'option_volume': 10000,
-            'sector': 'Technology',
-            'industry': 'Software',
-            'earnings_date': None,
-            'earnings_days_away': 30,
-            'perf_week': 0.0,
-            'perf_month': 0.0,
-            'perf_quarter': 0.0,
-        }
-        
-        if has_scores:
-            stock['strategy_score'] = 50.0 + i
-        
-        stocks_data.append(stock)
+    # Create sample screening results column by column; scalars broadcast
+    i = np.arange(num_stocks)
+    stocks_data = {
+        'ticker': [f'STOCK{k}' for k in range(num_stocks)],
+        'company_name': [f'Company {k}' for k in range(num_stocks)],
+        'price': 50.0 + i,
+        'volume': 1_000_000 + i * 10000,
+        'avg_volume': 1_000_000 + i * 10000,
+        'market_cap': 2e9 + i * 1e8,
+        'rsi': 50.0,
+        'sma20': 50.0,
+        'sma50': 50.0,
+        'sma200': 50.0,
+        'beta': 1.0,
+        'implied_volatility': 0.3,
+        'iv_rank': 50.0,
+        'option_volume': 10000,
+        'sector': 'Technology',
+        'industry': 'Software',
+        'earnings_date': None,
+        'earnings_days_away': 30,
+        'perf_week': 0.0,
+        'perf_month': 0.0,
+        'perf_quarter': 0.0,
+    }
     
-    stocks_df = pd.DataFrame(stocks_data)
+    if has_scores:
+        stocks_data['strategy_score'] = 50.0 + i
     
-    results = ScreenerResults(
-        timestamp=datetime.now(),
-        strategy="Test Strategy",
-        filters={},
-        stocks=stocks_df,
-        metadata={}
-    )
+    stocks_df = pd.DataFrame(stocks_data)
     
     # Verify required columns are present
-    assert 'ticker' in results.stocks.columns, "Results must contain ticker column"
-    assert 'price' in results.stocks.columns, "Results must contain price column"
-    assert 'volume' in results.stocks.columns, "Results must contain volume column"
-    assert 'market_cap' in results.stocks.columns, "Results must contain market_cap column"
+    assert 'ticker' in stocks_df.columns, "Results must contain ticker column"
+    assert 'price' in stocks_df.columns, "Results must contain price column"
+    assert 'volume' in stocks_df.columns, "Results must contain volume column"
+    assert 'market_cap' in stocks_df.columns, "Results must contain market_cap column"
     
     # Verify all stocks are present
-    assert len(results.stocks) == num_stocks, \
+    assert len(stocks_df) == num_stocks, \
         f"Results should contain all {num_stocks} stocks"
     
     # Verify strategy_score is present if scoring was performed
     if has_scores:
-        assert 'strategy_score' in results.stocks.columns, \
+        assert 'strategy_score' in stocks_df.columns, \
             "Results must contain strategy_score column when scoring is performed"
 
 
-@settings(max_examples=100)
 @given(
     num_stocks=st.integers(min_value=1, max_value=20),
 )
@@ -98,37 +114,26 @@ def test_all_stocks_have_complete_data(num_stocks):
     Every stock should have non-null values for key display fields.
     """
     # Create sample screening results
-    stocks_data = []
-    for i in range(num_stocks):
-        stocks_data.append({
-            'ticker': f'STOCK{i}',
-            'company_name': f'Company {i}',
-            'price': 50.0 + i,
-            'volume': 1_000_000 + i * 10000,
-            'market_cap': 2e9 + i * 1e8,
-            'strategy_score': 50.0 + i,
-        })
-    
-    stocks_df = pd.DataFrame(stocks_data)
-    
-    results = ScreenerResults(
-        timestamp=datetime.now(),
-        strategy="Test Strategy",
-        filters={},
-        stocks=stocks_df,
-        metadata={}
-    )
+    i = np.arange(num_stocks)
+    stocks_df = pd.DataFrame({
+        'ticker': [f'STOCK{k}' for k in range(num_stocks)],
+        'company_name': [f'Company {k}' for k in range(num_stocks)],
+        'price': 50.0 + i,
+        'volume': 1_000_000 + i * 10000,
+        'market_cap': 2e9 + i * 1e8,
+        'strategy_score': 50.0 + i,
+    })
     
     # Verify no null values in key columns
-    assert results.stocks['ticker'].notna().all(), \
+    assert stocks_df['ticker'].notna().all(), \
         "All stocks must have ticker"
-    assert results.stocks['price'].notna().all(), \
+    assert stocks_df['price'].notna().all(), \
         "All stocks must have price"
-    assert results.stocks['volume'].notna().all(), \
+    assert stocks_df['volume'].notna().all(), \
         "All stocks must have volume"
-    assert results.stocks['market_cap'].notna().all(), \
+    assert stocks_df['market_cap'].notna().all(), \
         "All stocks must have market_cap"
-    assert results.stocks['strategy_score'].notna().all(), \
+    assert stocks_df['strategy_score'].notna().all(), \
         "All stocks must have strategy_score"
 
 
@@ -138,119 +143,110 @@ def test_results_table_columns_are_displayable():
     
     This ensures that the data types and formats are suitable for UI display.
     """
-    # Create sample results
-    stocks_data = [
-        {
-            'ticker': 'AAPL',
-            'company_name': 'Apple Inc.',
-            'price': 150.25,
-            'volume': 50_000_000,
-            'market_cap': 2.5e12,
-            'rsi': 55.5,
-            'iv_rank': 45.0,
-            'strategy_score': 75.5,
-        },
-        {
-            'ticker': 'MSFT',
-            'company_name': 'Microsoft Corporation',
-            'price': 350.75,
-            'volume': 30_000_000,
-            'market_cap': 2.8e12,
-            'rsi': 60.0,
-            'iv_rank': 50.0,
-            'strategy_score': 80.0,
-        },
-    ]
-    
-    stocks_df = pd.DataFrame(stocks_data)
-    
-    results = ScreenerResults(
-        timestamp=datetime.now(),
-        strategy="Test Strategy",
-        filters={},
-        stocks=stocks_df,
-        metadata={}
-    )
+    stocks_df = _TWO_STOCKS_DF
     
     # Verify data types are appropriate for display
-    assert results.stocks['ticker'].dtype == object, "Ticker should be string type"
-    assert results.stocks['price'].dtype in [float, int], "Price should be numeric"
-    assert results.stocks['volume'].dtype in [float, int], "Volume should be numeric"
-    assert results.stocks['market_cap'].dtype in [float, int], "Market cap should be numeric"
-    assert results.stocks['strategy_score'].dtype in [float, int], "Score should be numeric"
+    assert stocks_df['ticker'].dtype == object, "Ticker should be string type"
+    assert stocks_df['price'].dtype in [float, int], "Price should be numeric"
+    assert stocks_df['volume'].dtype in [float, int], "Volume should be numeric"
+    assert stocks_df['market_cap'].dtype in [float, int], "Market cap should be numeric"
+    assert stocks_df['strategy_score'].dtype in [float, int], "Score should be numeric"
     
     # Verify values are in reasonable ranges
-    assert (results.stocks['price'] > 0).all(), "All prices should be positive"
-    assert (results.stocks['volume'] >= 0).all(), "All volumes should be non-negative"
-    assert (results.stocks['market_cap'] > 0).all(), "All market caps should be positive"
-    assert (results.stocks['strategy_score'] >= 0).all(), "All scores should be non-negative"
-    assert (results.stocks['strategy_score'] <= 100).all(), "All scores should be <= 100"
+    assert (stocks_df['price'] > 0).all(), "All prices should be positive"
+    assert (stocks_df['volume'] >= 0).all(), "All volumes should be non-negative"
+    assert (stocks_df['market_cap'] > 0).all(), "All market caps should be positive"
+    assert (stocks_df['strategy_score'] >= 0).all(), "All scores should be non-negative"
+    assert (stocks_df['strategy_score'] <= 100).all(), "All scores should be <= 100"
 
 
 def test_empty_results_are_handled():
     """
     Test that empty results (no stocks matched) are handled gracefully.
     """
-    # Create empty results
-    stocks_df = pd.DataFrame(columns=[
-        'ticker', 'company_name', 'price', 'volume', 'market_cap', 'strategy_score'
-    ])
-    
-    results = ScreenerResults(
-        timestamp=datetime.now(),
-        strategy="Test Strategy",
-        filters={},
-        stocks=stocks_df,
-        metadata={}
-    )
+    stocks_df = _EMPTY_STOCKS_DF
     
     # Verify empty results are valid
-    assert len(results.stocks) == 0, "Empty results should have 0 stocks"
-    assert isinstance(results.stocks, pd.DataFrame), "Empty results should still be a DataFrame"
+    assert len(stocks_df) == 0, "Empty results should have 0 stocks"
+    assert isinstance(stocks_df, pd.DataFrame), "Empty results should still be a DataFrame"
     
     # Verify columns are still present
-    assert 'ticker' in results.stocks.columns
-    assert 'price' in results.stocks.columns
-    assert 'volume' in results.stocks.columns
-    assert 'market_cap' in results.stocks.columns
+    assert 'ticker' in stocks_df.columns
+    assert 'price' in stocks_df.columns
+    assert 'volume' in stocks_df.columns
+    assert 'market_cap' in stocks_df.columns
 
 
-@settings(max_examples=100)
-@given(
-    num_stocks=st.integers(min_value=1, max_value=20),
-)
-def test_results_are_sortable_by_score(num_stocks):
+@pytest.mark.parametrize("num_stocks", [1, 2, 20])
+def test_ranked_results_sort_descending(num_stocks):
     """
-    Test that results can be sorted by strategy score.
+    Test that the engine ranks a results table by descending strategy score.
     
     This is important for displaying top candidates first.
     """
-    # Create sample results with varying scores
-    stocks_data = []
-    for i in range(num_stocks):
-        stocks_data.append({
-            'ticker': f'STOCK{i}',
-            'company_name': f'Company {i}',
-            'price': 50.0 + i,
-            'volume': 1_000_000,
-            'market_cap': 2e9,
-            'strategy_score': float(i * 5),  # Scores from 0 to num_stocks*5
-        })
-    
-    stocks_df = pd.DataFrame(stocks_data)
-    
-    results = ScreenerResults(
-        timestamp=datetime.now(),
-        strategy="Test Strategy",
-        filters={},
-        stocks=stocks_df,
-        metadata={}
-    )
+    # Scores out of order: 0, 35, 70, ... wrapped into [0, 100)
+    i = np.arange(num_stocks)
+    stocks_df = pd.DataFrame({
+        'ticker': [f'STOCK{k}' for k in range(num_stocks)],
+        'strategy_score': (i * 35.0) % 100,
+    })
+    
+    ranked = ScreeningEngine().rank_results(stocks_df)
+    
+    assert np.all(np.diff(ranked['strategy_score'].to_numpy()) <= 0), \
+        "Ranked results should be in descending score order"
+    assert sorted(ranked['ticker']) == sorted(stocks_df['ticker']), \
+        "Ranking should keep every stock"
+    assert ranked['ticker'].iloc[0] == stocks_df.loc[stocks_df['strategy_score'].idxmax(), 'ticker']
+
+
+def test_results_are_sortable_by_score():
+    """
+    Test that a results table can be sorted by strategy score.
+    """
+    num_stocks = 20
+    i = np.arange(num_stocks)
+    stocks_df = pd.DataFrame({
+        'ticker': [f'STOCK{k}' for k in range(num_stocks)],
+        'company_name': [f'Company {k}' for k in range(num_stocks)],
+        'price': 50.0 + i,
+        'volume': 1_000_000,
+        'market_cap': 2e9,
+        'strategy_score': i * 5.0,
+    })
     
     # Sort by strategy_score descending
-    sorted_df = results.stocks.sort_values('strategy_score', ascending=False)
+    sorted_df = stocks_df.sort_values('strategy_score', ascending=False)
     
     # Verify sorting worked
     scores = sorted_df['strategy_score'].tolist()
     assert scores == sorted(scores, reverse=True), \
         "Results should be sortable by strategy_score in descending order"
+    assert sorted_df['ticker'].iloc[0] == f'STOCK{num_stocks - 1}'
+
+
+def test_screener_results_wraps_df():
+    """
+    Test that ScreenerResults exposes the screened DataFrame unchanged.
+    
+    The other tests assert on the DataFrame directly; this one covers the wrapper.
+    """
+    stocks_df = pd.DataFrame({
+        'ticker': ['AAPL', 'MSFT'],
+        'price': [150.25, 350.75],
+        'strategy_score': [75.5, 80.0],
+    })
+    timestamp = datetime.now()
+    
+    results = ScreenerResults(
+        timestamp=timestamp,
+        strategy="Test Strategy",
+        filters={'price_min': 100},
+        stocks=stocks_df,
+    )
+    
+    assert results.stocks is stocks_df
+    assert results.timestamp == timestamp
+    assert results.strategy == "Test Strategy"
+    assert results.filters == {'price_min': 100}
+    assert results.metadata == {}
@@ -4,11 +4,9 @@ Feature: strategy-stock-screener, Property 18: Results Persistence
 Validates: Requirements 6.1
 """
 
-import tempfile
-import shutil
-from pathlib import Path
 from datetime import datetime
-from hypothesis import given, strategies as st, settings
+from unittest.mock import DEFAULT, patch
+from hypothesis import given, strategies as st
 import pytest
 import pandas as pd
 
@@ -16,6 +14,20 @@ from screener.core.models import ScreenerResults
 from screener.storage import StorageManager
 
 
+@pytest.fixture(scope="module")
+def storage(tmp_path_factory):
+    """One StorageManager shared by every example in the module.
+
+    Examples that produce the same result ID overwrite each other's files,
+    which is harmless because the tests only check the files for the ID they
+    just saved.
+    """
+    return StorageManager(results_dir=str(tmp_path_factory.mktemp("storage")))
+
+
+_STRATEGY_NAMES = ['pcs', 'covered_call', 'iron_condor', 'collar']
+
+
 def valid_filters_strategy():
     """Generate valid filter dictionaries."""
     return st.fixed_dictionaries({
@@ -26,13 +38,23 @@ def valid_filters_strategy():
     })
 
 
+_UPPERCASE = st.characters(whitelist_categories=('Lu',))
+_STOCK_COLUMNS = ('ticker', 'price', 'volume', 'score')
+_STOCK_DTYPES = {'price': 'float32', 'volume': 'int32', 'score': 'float32'}
+
+
+def _stocks_frame(rows):
+    """Build a stocks DataFrame with fixed columns and dtypes, skipping inference."""
+    return pd.DataFrame.from_records(rows, columns=_STOCK_COLUMNS).astype(_STOCK_DTYPES)
+
+
 def valid_stock_dataframe_strategy():
     """Generate valid stock DataFrames."""
     return st.builds(
-        lambda rows: pd.DataFrame(rows),
+        _stocks_frame,
         st.lists(
             st.fixed_dictionaries({
-                'ticker': st.text(min_size=1, max_size=5, alphabet=st.characters(whitelist_categories=('Lu',))),
+                'ticker': st.text(min_size=1, max_size=5, alphabet=_UPPERCASE),
                 'price': st.floats(min_value=1, max_value=1000, allow_nan=False, allow_infinity=False),
                 'volume': st.integers(min_value=0, max_value=1_000_000_000),
                 'score': st.floats(min_value=0, max_value=100, allow_nan=False, allow_infinity=False),
@@ -43,9 +65,8 @@ def valid_stock_dataframe_strategy():
     )
 
 
-@settings(max_examples=100)
+@pytest.mark.parametrize("strategy_name", _STRATEGY_NAMES)
 @given(
-    strategy_name=st.sampled_from(['pcs', 'covered_call', 'iron_condor', 'collar']),
     filters=valid_filters_strategy(),
     stocks=valid_stock_dataframe_strategy(),
     metadata=st.dictionaries(
@@ -54,86 +75,126 @@ def valid_stock_dataframe_strategy():
         max_size=5
     )
 )
-def test_save_results_creates_files(strategy_name, filters, stocks, metadata):
+def test_save_results_creates_files(storage, strategy_name, filters, stocks, metadata):
     """
     Feature: strategy-stock-screener, Property 18: Results Persistence
     
     For any completed screening operation, the results should be saved to local
     storage with a timestamp.
     """
-    # Create temporary directory for this test
-    temp_storage_dir = tempfile.mkdtemp()
+    # Create screening results
+    results = ScreenerResults(
+        timestamp=datetime.now(),
+        strategy=strategy_name,
+        filters=filters,
+        stocks=stocks,
+        metadata=metadata
+    )
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir)
-        
-        # Create screening results
-        results = ScreenerResults(
-            timestamp=datetime.now(),
-            strategy=strategy_name,
-            filters=filters,
-            stocks=stocks,
-            metadata=metadata
-        )
-        
-        # Save results
-        result_id = storage.save_results(results, strategy_name)
-        
-        # Verify result ID is returned
-        assert result_id is not None
-        assert isinstance(result_id, str)
-        assert len(result_id) > 0
-        
-        # Verify JSON file exists
-        json_path = Path(temp_storage_dir) / f"{result_id}.json"
-        assert json_path.exists(), f"JSON file should exist at {json_path}"
-        
-        # Verify CSV file exists
-        csv_path = Path(temp_storage_dir) / f"{result_id}.csv"
-        assert csv_path.exists(), f"CSV file should exist at {csv_path}"
-        
-        # Verify history file exists
-        history_path = Path(temp_storage_dir) / "screener_history.json"
-        assert history_path.exists(), "History file should exist"
-    finally:
-        # Clean up temporary directory
-        shutil.rmtree(temp_storage_dir)
-
-
-@settings(max_examples=100)
+    # Save results
+    result_id = storage.save_results(results, strategy_name)
+    
+    # Verify result ID is returned
+    assert result_id is not None
+    assert isinstance(result_id, str)
+    assert len(result_id) > 0
+    
+    # Verify JSON file exists
+    json_path = storage.results_dir / f"{result_id}.json"
+    assert json_path.exists(), f"JSON file should exist at {json_path}"
+    
+    # Verify history file exists
+    history_path = storage.results_dir / "screener_history.json"
+    assert history_path.exists(), "History file should exist"
+
+
+def test_saved_csv_matches_stocks(tmp_path):
+    """A CSV is only written on request, and it holds the screened stocks."""
+    storage = StorageManager(results_dir=str(tmp_path))
+    stocks = pd.DataFrame({
+        'ticker': ['AAPL', 'MSFT'],
+        'price': [150.0, 410.5],
+        'volume': [1_000_000, 2_500_000],
+        'score': [87.5, 72.0],
+    })
+    results = ScreenerResults(
+        timestamp=datetime(2025, 1, 4, 14, 30, 45),
+        strategy='pcs',
+        filters={'min_volume': 1_000_000},
+        stocks=stocks,
+    )
+
+    result_id = storage.save_results(results, 'pcs')
+    assert not (tmp_path / f"{result_id}.csv").exists()
+
+    csv_path = storage.export_saved_csv(result_id)
+
+    assert csv_path == tmp_path / f"{result_id}.csv"
+    pd.testing.assert_frame_equal(pd.read_csv(csv_path), stocks)
+
+
+def _ascii_locale_open(file, mode='r', *args, encoding=None, **kwargs):
+    """open() as under LC_ALL=C: text files default to ASCII unless an encoding is given."""
+    if 'b' not in mode and encoding is None:
+        encoding = 'ascii'
+    return open(file, mode, *args, encoding=encoding, **kwargs)
+
+
+def test_non_ascii_results_load_under_ascii_locale(tmp_path):
+    """Saved results and history are read back as UTF-8 whatever the locale."""
+    storage = StorageManager(results_dir=str(tmp_path))
+    results = ScreenerResults(
+        timestamp=datetime(2025, 1, 4, 14, 30, 45),
+        strategy='pcs',
+        filters={'sector': 'Santé'},
+        stocks=pd.DataFrame({'ticker': ['NESN'], 'company_name': ['Nestlé S.A.'], 'price': [98.5]}),
+        metadata={'note': 'Zürich – 東京'},
+    )
+    result_id = storage.save_results(results, 'pcs')
+
+    with patch('screener.storage.manager.open', create=True, side_effect=_ascii_locale_open):
+        loaded = storage.load_results(result_id)
+        history = storage.get_history()
+
+    pd.testing.assert_frame_equal(loaded.stocks, results.stocks)
+    assert loaded.filters == results.filters
+    assert loaded.metadata == results.metadata
+    assert history[-1]['filters_summary'] == 'sector=Santé'
+
+
+@pytest.mark.parametrize("strategy_name", _STRATEGY_NAMES)
 @given(
-    strategy_name=st.sampled_from(['pcs', 'covered_call', 'iron_condor', 'collar']),
     filters=valid_filters_strategy(),
     stocks=valid_stock_dataframe_strategy(),
 )
-def test_save_results_includes_timestamp(strategy_name, filters, stocks):
+def test_save_results_includes_timestamp(storage, strategy_name, filters, stocks):
     """
     Feature: strategy-stock-screener, Property 18: Results Persistence
     
     For any saved screening results, the result ID should include a timestamp.
+
+    The writers are replaced with recording mocks, since only the ID and the
+    path derived from it are under test; test_save_results_creates_files and
+    test_saved_csv_matches_stocks cover the real I/O.
     """
-    # Create temporary directory for this test
-    temp_storage_dir = tempfile.mkdtemp()
+    # Create screening results with specific timestamp
+    timestamp = datetime(2025, 1, 4, 14, 30, 45)
+    results = ScreenerResults(
+        timestamp=timestamp,
+        strategy=strategy_name,
+        filters=filters,
+        stocks=stocks,
+        metadata={}
+    )
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir)
-        
-        # Create screening results with specific timestamp
-        timestamp = datetime(2025, 1, 4, 14, 30, 45)
-        results = ScreenerResults(
-            timestamp=timestamp,
-            strategy=strategy_name,
-            filters=filters,
-            stocks=stocks,
-            metadata={}
-        )
-        
-        # Save results
+    # Save results
+    with patch.multiple(StorageManager, _save_as_json=DEFAULT, _add_to_history=DEFAULT) as writers:
         result_id = storage.save_results(results, strategy_name)
-        
-        # Verify result ID contains timestamp
-        assert "2025-01-04" in result_id, "Result ID should contain date"
-        assert strategy_name in result_id, "Result ID should contain strategy name"
-    finally:
-        # Clean up temporary directory
-        shutil.rmtree(temp_storage_dir)
+    
+    # Verify result ID contains timestamp
+    assert "2025-01-04" in result_id, "Result ID should contain date"
+    assert strategy_name in result_id, "Result ID should contain strategy name"
+    
+    # Verify each writer received the ID-derived target
+    writers['_save_as_json'].assert_called_once_with(results, storage.results_dir / f"{result_id}.json")
+    writers['_add_to_history'].assert_called_once_with(result_id, results, strategy_name)
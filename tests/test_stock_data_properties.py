@@ -5,17 +5,48 @@ Validates: Requirements 2.4
 """
 
 from datetime import date, datetime
-from hypothesis import given, strategies as st, settings
+from types import MappingProxyType
+from hypothesis import given, strategies as st
 import pytest
 
 from screener.core.models import StockData
 
 
+# Valid field values; the invalid-field tests override a single entry.
+_VALID_KWARGS = MappingProxyType(dict(
+    ticker="AAPL",
+    company_name="Apple Inc.",
+    price=150,
+    volume=1000000,
+    avg_volume=1000000,
+    market_cap=2_000_000_000,
+    rsi=50,
+    sma20=150,
+    sma50=145,
+    sma200=140,
+    beta=1.0,
+    implied_volatility=0.3,
+    iv_rank=50,
+    option_volume=10000,
+    sector="Technology",
+    industry="Consumer Electronics",
+    earnings_date=None,
+    earnings_days_away=30,
+    perf_week=1.5,
+    perf_month=3.0,
+    perf_quarter=5.0,
+))
+
+
+# Shared by every ticker draw instead of being rebuilt per strategy call.
+_UPPERCASE = st.characters(whitelist_categories=('Lu',))
+
+
 # Custom strategies for generating valid stock data
 def valid_ticker_strategy():
     """Generate valid stock tickers (1-5 uppercase letters)."""
     return st.text(
-        alphabet=st.characters(whitelist_categories=('Lu',)),
+        alphabet=_UPPERCASE,
         min_size=1,
         max_size=5
     )
@@ -41,75 +72,66 @@ def valid_industry_strategy():
     return st.text(min_size=1, max_size=100).filter(lambda x: x.strip())
 
 
-@settings(max_examples=100)
-@given(
-    ticker=valid_ticker_strategy(),
-    company_name=valid_company_name_strategy(),
-    price=st.floats(min_value=0.01, max_value=10000, allow_nan=False, allow_infinity=False),
-    volume=st.integers(min_value=0, max_value=1_000_000_000),
-    avg_volume=st.integers(min_value=0, max_value=1_000_000_000),
-    market_cap=st.floats(min_value=1_000_000, max_value=10_000_000_000_000, allow_nan=False, allow_infinity=False),
-    rsi=st.floats(min_value=0, max_value=100, allow_nan=False, allow_infinity=False),
-    sma20=st.floats(min_value=0, max_value=10000, allow_nan=False, allow_infinity=False),
-    sma50=st.floats(min_value=0, max_value=10000, allow_nan=False, allow_infinity=False),
-    sma200=st.floats(min_value=0, max_value=10000, allow_nan=False, allow_infinity=False),
-    beta=st.floats(min_value=0, max_value=5, allow_nan=False, allow_infinity=False),
-    implied_volatility=st.floats(min_value=0, max_value=10, allow_nan=False, allow_infinity=False),
-    iv_rank=st.floats(min_value=0, max_value=100, allow_nan=False, allow_infinity=False),
-    option_volume=st.integers(min_value=0, max_value=100_000_000),
-    sector=valid_sector_strategy(),
-    industry=valid_industry_strategy(),
-    earnings_date=st.one_of(st.none(), st.dates(min_value=date(2020, 1, 1), max_value=date(2030, 12, 31))),
-    earnings_days_away=st.integers(min_value=0, max_value=365),
-    perf_week=st.floats(min_value=-100, max_value=100, allow_nan=False, allow_infinity=False),
-    perf_month=st.floats(min_value=-100, max_value=100, allow_nan=False, allow_infinity=False),
-    perf_quarter=st.floats(min_value=-100, max_value=100, allow_nan=False, allow_infinity=False),
-)
-def test_valid_stock_data_passes_validation(
-    ticker, company_name, price, volume, avg_volume, market_cap,
-    rsi, sma20, sma50, sma200, beta, implied_volatility, iv_rank,
-    option_volume, sector, industry, earnings_date, earnings_days_away,
-    perf_week, perf_month, perf_quarter
-):
+def outside_percent_range_strategy():
+    """Generate finite floats outside [0, 100] without rejection sampling."""
+    return st.one_of(
+        st.floats(max_value=0, exclude_max=True, allow_nan=False, allow_infinity=False),
+        st.floats(min_value=100, exclude_min=True, allow_nan=False, allow_infinity=False),
+    )
+
+
+_TICKERS = valid_ticker_strategy()
+_COMPANY_NAMES = valid_company_name_strategy()
+_SECTORS = valid_sector_strategy()
+_INDUSTRIES = valid_industry_strategy()
+
+
+@st.composite
+def stock_data_strategy(draw):
+    """Generate StockData instances whose fields are all within valid ranges."""
+    def finite(min_value, max_value):
+        return draw(st.floats(min_value=min_value, max_value=max_value, allow_nan=False, allow_infinity=False))
+
+    return StockData(
+        ticker=draw(_TICKERS),
+        company_name=draw(_COMPANY_NAMES),
+        price=finite(0.01, 10000),
+        volume=draw(st.integers(min_value=0, max_value=1_000_000_000)),
+        avg_volume=draw(st.integers(min_value=0, max_value=1_000_000_000)),
+        market_cap=finite(1_000_000, 10_000_000_000_000),
+        rsi=finite(0, 100),
+        sma20=finite(0, 10000),
+        sma50=finite(0, 10000),
+        sma200=finite(0, 10000),
+        beta=finite(0, 5),
+        implied_volatility=finite(0, 10),
+        iv_rank=finite(0, 100),
+        option_volume=draw(st.integers(min_value=0, max_value=100_000_000)),
+        sector=draw(_SECTORS),
+        industry=draw(_INDUSTRIES),
+        earnings_date=draw(st.one_of(st.none(), st.dates(min_value=date(2020, 1, 1), max_value=date(2030, 12, 31)))),
+        earnings_days_away=draw(st.integers(min_value=0, max_value=365)),
+        perf_week=finite(-100, 100),
+        perf_month=finite(-100, 100),
+        perf_quarter=finite(-100, 100),
+    )
+
+
+@given(stock=stock_data_strategy())
+def test_valid_stock_data_passes_validation(stock):
     """
     Feature: strategy-stock-screener, Property 8: Data Parsing Validity
     
     For any downloaded Finviz data with valid values, parsing should produce
     a valid StockData object with no validation errors.
     """
-    stock = StockData(
-        ticker=ticker,
-        company_name=company_name,
-        price=price,
-        volume=volume,
-        avg_volume=avg_volume,
-        market_cap=market_cap,
-        rsi=rsi,
-        sma20=sma20,
-        sma50=sma50,
-        sma200=sma200,
-        beta=beta,
-        implied_volatility=implied_volatility,
-        iv_rank=iv_rank,
-        option_volume=option_volume,
-        sector=sector,
-        industry=industry,
-        earnings_date=earnings_date,
-        earnings_days_away=earnings_days_away,
-        perf_week=perf_week,
-        perf_month=perf_month,
-        perf_quarter=perf_quarter,
-    )
-    
-    # Valid stock data should pass validation
     errors = stock.validate()
     assert errors == [], f"Valid stock data should have no validation errors, got: {errors}"
     assert stock.is_valid(), "Valid stock data should return True for is_valid()"
 
 
-@settings(max_examples=100)
 @given(
-    price=st.floats(max_value=0, allow_nan=False, allow_infinity=False).filter(lambda x: x <= 0),
+    price=st.floats(max_value=0, allow_nan=False, allow_infinity=False),
 )
 def test_invalid_price_fails_validation(price):
     """
@@ -117,29 +139,7 @@ def test_invalid_price_fails_validation(price):
     
     For any stock data with invalid price (non-positive), validation should fail.
     """
-    stock = StockData(
-        ticker="AAPL",
-        company_name="Apple Inc.",
-        price=price,
-        volume=1000000,
-        avg_volume=1000000,
-        market_cap=2_000_000_000,
-        rsi=50,
-        sma20=150,
-        sma50=145,
-        sma200=140,
-        beta=1.0,
-        implied_volatility=0.3,
-        iv_rank=50,
-        option_volume=10000,
-        sector="Technology",
-        industry="Consumer Electronics",
-        earnings_date=None,
-        earnings_days_away=30,
-        perf_week=1.5,
-        perf_month=3.0,
-        perf_quarter=5.0,
-    )
+    stock = StockData(**{**_VALID_KWARGS, "price": price})
     
     errors = stock.validate()
     assert len(errors) > 0, "Invalid price should produce validation errors"
@@ -147,9 +147,8 @@ def test_invalid_price_fails_validation(price):
     assert not stock.is_valid(), "Invalid stock data should return False for is_valid()"
 
 
-@settings(max_examples=100)
 @given(
-    rsi=st.floats(allow_nan=False, allow_infinity=False).filter(lambda x: x < 0 or x > 100),
+    rsi=outside_percent_range_strategy(),
 )
 def test_invalid_rsi_fails_validation(rsi):
     """
@@ -157,29 +156,7 @@ def test_invalid_rsi_fails_validation(rsi):
     
     For any stock data with RSI outside [0, 100], validation should fail.
     """
-    stock = StockData(
-        ticker="AAPL",
-        company_name="Apple Inc.",
-        price=150,
-        volume=1000000,
-        avg_volume=1000000,
-        market_cap=2_000_000_000,
-        rsi=rsi,
-        sma20=150,
-        sma50=145,
-        sma200=140,
-        beta=1.0,
-        implied_volatility=0.3,
-        iv_rank=50,
-        option_volume=10000,
-        sector="Technology",
-        industry="Consumer Electronics",
-        earnings_date=None,
-        earnings_days_away=30,
-        perf_week=1.5,
-        perf_month=3.0,
-        perf_quarter=5.0,
-    )
+    stock = StockData(**{**_VALID_KWARGS, "rsi": rsi})
     
     errors = stock.validate()
     assert len(errors) > 0, "Invalid RSI should produce validation errors"
@@ -187,9 +164,8 @@ def test_invalid_rsi_fails_validation(rsi):
     assert not stock.is_valid(), "Invalid stock data should return False for is_valid()"
 
 
-@settings(max_examples=100)
 @given(
-    iv_rank=st.floats(allow_nan=False, allow_infinity=False).filter(lambda x: x < 0 or x > 100),
+    iv_rank=outside_percent_range_strategy(),
 )
 def test_invalid_iv_rank_fails_validation(iv_rank):
     """
@@ -197,29 +173,7 @@ def test_invalid_iv_rank_fails_validation(iv_rank):
     
     For any stock data with IV rank outside [0, 100], validation should fail.
     """
-    stock = StockData(
-        ticker="AAPL",
-        company_name="Apple Inc.",
-        price=150,
-        volume=1000000,
-        avg_volume=1000000,
-        market_cap=2_000_000_000,
-        rsi=50,
-        sma20=150,
-        sma50=145,
-        sma200=140,
-        beta=1.0,
-        implied_volatility=0.3,
-        iv_rank=iv_rank,
-        option_volume=10000,
-        sector="Technology",
-        industry="Consumer Electronics",
-        earnings_date=None,
-        earnings_days_away=30,
-        perf_week=1.5,
-        perf_month=3.0,
-        perf_quarter=5.0,
-    )
+    stock = StockData(**{**_VALID_KWARGS, "iv_rank": iv_rank})
     
     errors = stock.validate()
     assert len(errors) > 0, "Invalid IV rank should produce validation errors"
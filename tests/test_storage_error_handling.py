@@ -4,8 +4,6 @@ Tests write failure recovery and read failure fallback.
 Requirements: 6.6
 """
 
-import tempfile
-import shutil
 import os
 from pathlib import Path
 from datetime import datetime
@@ -18,233 +16,194 @@ from screener.core.models import ScreenerResults
 from screener.storage import StorageManager, StorageError
 
 
-def test_save_json_retries_on_io_error():
+@pytest.fixture(scope="module")
+def sample_results():
+    """One ScreenerResults for the save tests; they only exercise the retry loops."""
+    return ScreenerResults(
+        timestamp=datetime(2025, 1, 1),
+        strategy='pcs',
+        filters={'min_volume': 1000000},
+        stocks=pd.DataFrame({'ticker': ['AAPL'], 'price': [150.0]}),
+        metadata={}
+    )
+
+
+@pytest.fixture
+def storage_dir(fs):
+    """Results directory on pyfakefs' in-memory filesystem.
+
+    The retry tests only exercise control flow, so they never touch the disk.
+    """
+    return Path(fs.create_dir("/storage").path)
+
+
+def test_save_json_retries_on_io_error(storage_dir, sample_results):
     """
     Test that save operations retry on IO errors.
     
     Requirements: 6.6
     """
-    temp_storage_dir = tempfile.mkdtemp()
+    storage = StorageManager(results_dir=str(storage_dir), max_retries=2)
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir, max_retries=2)
-        
-        results = ScreenerResults(
-            timestamp=datetime.now(),
-            strategy='pcs',
-            filters={'min_volume': 1000000},
-            stocks=pd.DataFrame({'ticker': ['AAPL'], 'price': [150.0]}),
-            metadata={}
-        )
-        
-        # Mock open to fail twice then succeed
-        call_count = {'count': 0}
-        original_open = open
-        
-        def mock_open_func(*args, **kwargs):
-            call_count['count'] += 1
-            if call_count['count'] <= 2:
-                raise IOError("Simulated IO error")
-            return original_open(*args, **kwargs)
-        
-        with patch('builtins.open', side_effect=mock_open_func):
-            # This should succeed after retries
-            result_id = storage.save_results(results, 'pcs')
-        
-        # Verify the result was eventually saved
-        assert result_id is not None
-        
-    finally:
-        shutil.rmtree(temp_storage_dir)
+    # Mock open to fail twice then succeed
+    call_count = {'count': 0}
+    original_open = open
+    
+    def mock_open_func(*args, **kwargs):
+        call_count['count'] += 1
+        if call_count['count'] <= 2:
+            raise IOError("Simulated IO error")
+        return original_open(*args, **kwargs)
+    
+    with patch('screener.storage.manager.open', create=True, side_effect=mock_open_func):
+        # This should succeed after retries
+        result_id = storage.save_results(sample_results, 'pcs')
+    
+    # Verify the result was eventually saved
+    assert result_id is not None
 
 
-def test_save_json_raises_error_after_max_retries():
+def test_save_json_raises_error_after_max_retries(storage_dir, sample_results):
     """
     Test that save operations raise StorageError after max retries.
     
     Requirements: 6.6
     """
-    temp_storage_dir = tempfile.mkdtemp()
+    storage = StorageManager(results_dir=str(storage_dir), max_retries=1)
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir, max_retries=1)
-        
-        results = ScreenerResults(
-            timestamp=datetime.now(),
-            strategy='pcs',
-            filters={'min_volume': 1000000},
-            stocks=pd.DataFrame({'ticker': ['AAPL'], 'price': [150.0]}),
-            metadata={}
-        )
+    # Mock open to always fail
+    with patch('screener.storage.manager.open', create=True, side_effect=IOError("Persistent IO error")):
+        with pytest.raises(StorageError) as exc_info:
+            storage.save_results(sample_results, 'pcs')
         
-        # Mock open to always fail
-        with patch('builtins.open', side_effect=IOError("Persistent IO error")):
-            with pytest.raises(StorageError) as exc_info:
-                storage.save_results(results, 'pcs')
-            
-            assert "Failed to save JSON" in str(exc_info.value)
-            assert "attempts" in str(exc_info.value)
-        
-    finally:
-        shutil.rmtree(temp_storage_dir)
+        assert "Failed to save JSON" in str(exc_info.value)
+        assert "attempts" in str(exc_info.value)
 
 
-def test_load_results_retries_on_io_error():
+def test_load_results_retries_on_io_error(storage_dir):
     """
     Test that load operations retry on IO errors.
     
     Requirements: 6.6
     """
-    temp_storage_dir = tempfile.mkdtemp()
+    storage = StorageManager(results_dir=str(storage_dir), max_retries=2)
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir, max_retries=2)
-        
-        # First, save a result normally
-        results = ScreenerResults(
-            timestamp=datetime.now(),
-            strategy='pcs',
-            filters={'min_volume': 1000000},
-            stocks=pd.DataFrame({'ticker': ['AAPL'], 'price': [150.0]}),
-            metadata={}
-        )
-        result_id = storage.save_results(results, 'pcs')
-        
-        # Now mock open to fail twice then succeed for reading
-        call_count = {'count': 0}
-        original_open = open
-        
-        def mock_open_func(path, *args, **kwargs):
-            if 'r' in args or kwargs.get('mode') == 'r':
-                call_count['count'] += 1
-                if call_count['count'] <= 2:
-                    raise IOError("Simulated read error")
-            return original_open(path, *args, **kwargs)
-        
-        with patch('builtins.open', side_effect=mock_open_func):
-            # This should succeed after retries
-            loaded_results = storage.load_results(result_id)
-        
-        # Verify the result was loaded
-        assert loaded_results.strategy == 'pcs'
-        
-    finally:
-        shutil.rmtree(temp_storage_dir)
+    # Only the file's existence is checked before reading; the module's reader supplies the data
+    result_id = "2025-01-04_143000_pcs"
+    (storage_dir / f"{result_id}.json").touch()
+    saved = {
+        'timestamp': '2025-01-04T14:30:00',
+        'strategy': 'pcs',
+        'filters': {'min_volume': 1000000},
+        'stocks': [{'ticker': 'AAPL', 'price': 150.0}],
+        'metadata': {},
+    }
+    
+    # Fail twice, then return the saved payload
+    with patch('screener.storage.manager._read_json', side_effect=[IOError("Simulated read error"), IOError("Simulated read error"), saved]) as mock_load:
+        # This should succeed after retries
+        loaded_results = storage.load_results(result_id)
+    
+    # Verify the result was loaded
+    assert mock_load.call_count == 3
+    assert loaded_results.strategy == 'pcs'
 
 
-def test_load_results_raises_error_after_max_retries():
+def test_load_results_raises_error_after_max_retries(storage_dir):
     """
     Test that load operations raise StorageError after max retries.
     
     Requirements: 6.6
     """
-    temp_storage_dir = tempfile.mkdtemp()
+    storage = StorageManager(results_dir=str(storage_dir), max_retries=1)
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir, max_retries=1)
-        
-        # Create a dummy file
-        result_id = "2025-01-04_143000_pcs"
-        json_path = Path(temp_storage_dir) / f"{result_id}.json"
-        json_path.touch()
-        
-        # Mock open to always fail for reading
-        def mock_open_func(path, *args, **kwargs):
-            if 'r' in args or kwargs.get('mode') == 'r':
-                raise IOError("Persistent read error")
-            return open(path, *args, **kwargs)
-        
-        with patch('builtins.open', side_effect=mock_open_func):
-            with pytest.raises(StorageError) as exc_info:
-                storage.load_results(result_id)
-            
-            assert "Failed to load results" in str(exc_info.value)
-            assert "attempts" in str(exc_info.value)
+    # Create a dummy file
+    result_id = "2025-01-04_143000_pcs"
+    json_path = storage_dir / f"{result_id}.json"
+    json_path.touch()
+    
+    # Mock open to always fail for reading
+    def mock_open_func(path, *args, **kwargs):
+        if 'r' in args or kwargs.get('mode') == 'r':
+            raise IOError("Persistent read error")
+        return open(path, *args, **kwargs)
+    
+    with patch('screener.storage.manager.open', create=True, side_effect=mock_open_func):
+        with pytest.raises(StorageError) as exc_info:
+            storage.load_results(result_id)
         
-    finally:
-        shutil.rmtree(temp_storage_dir)
+        assert "Failed to load results" in str(exc_info.value)
+        assert "attempts" in str(exc_info.value)
 
 
-def test_load_history_returns_empty_on_corrupted_file():
+def test_load_history_returns_empty_on_corrupted_file(storage_dir):
     """
     Test that load_history returns empty list when history file is corrupted.
     
     Requirements: 6.6
     """
-    temp_storage_dir = tempfile.mkdtemp()
+    storage = StorageManager(results_dir=str(storage_dir), max_retries=1)
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir, max_retries=1)
-        
-        # Create a corrupted history file
-        history_path = Path(temp_storage_dir) / "screener_history.json"
-        with open(history_path, 'w') as f:
-            f.write("{ invalid json }")
-        
-        # get_history should return empty list as fallback
-        history = storage.get_history()
-        
-        assert history == [], "Corrupted history file should return empty list"
-        
-    finally:
-        shutil.rmtree(temp_storage_dir)
+    # Create a corrupted history file
+    history_path = storage_dir / "screener_history.json"
+    with open(history_path, 'w') as f:
+        f.write("{ invalid json }")
+    
+    # get_history should return empty list as fallback
+    history = storage.get_history()
+    
+    assert history == [], "Corrupted history file should return empty list"
 
 
-def test_load_nonexistent_file_raises_file_not_found():
+def test_load_nonexistent_file_raises_file_not_found(storage_dir):
     """
     Test that loading non-existent results raises FileNotFoundError.
     
     Requirements: 6.6
     """
-    temp_storage_dir = tempfile.mkdtemp()
+    storage = StorageManager(results_dir=str(storage_dir))
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir)
-        
-        with pytest.raises(FileNotFoundError) as exc_info:
-            storage.load_results("nonexistent_id")
-        
-        assert "Results not found" in str(exc_info.value)
-        
-    finally:
-        shutil.rmtree(temp_storage_dir)
+    with pytest.raises(FileNotFoundError) as exc_info:
+        storage.load_results("nonexistent_id")
+    
+    assert "Results not found" in str(exc_info.value)
 
 
-def test_csv_save_retries_on_error():
+def test_csv_save_retries_on_error(storage_dir, sample_results):
     """
     Test that CSV save operations retry on errors.
     
     Requirements: 6.6
     """
-    temp_storage_dir = tempfile.mkdtemp()
+    storage = StorageManager(results_dir=str(storage_dir), max_retries=2)
+    result_id = storage.save_results(sample_results, 'pcs')
     
-    try:
-        storage = StorageManager(results_dir=temp_storage_dir, max_retries=2)
-        
-        results = ScreenerResults(
-            timestamp=datetime.now(),
-            strategy='pcs',
-            filters={'min_volume': 1000000},
-            stocks=pd.DataFrame({'ticker': ['AAPL'], 'price': [150.0]}),
-            metadata={}
-        )
-        
-        # Mock DataFrame.to_csv to fail twice then succeed
-        call_count = {'count': 0}
-        original_to_csv = pd.DataFrame.to_csv
-        
-        def mock_to_csv(self, *args, **kwargs):
-            call_count['count'] += 1
-            if call_count['count'] <= 2:
-                raise IOError("Simulated CSV write error")
-            return original_to_csv(self, *args, **kwargs)
-        
-        with patch.object(pd.DataFrame, 'to_csv', mock_to_csv):
-            # This should succeed after retries
-            result_id = storage.save_results(results, 'pcs')
-        
-        # Verify the result was eventually saved
-        assert result_id is not None
-        
-    finally:
-        shutil.rmtree(temp_storage_dir)
+    # Mock DataFrame.to_csv to fail twice then succeed
+    call_count = {'count': 0}
+    original_to_csv = pd.DataFrame.to_csv
+    
+    def mock_to_csv(self, *args, **kwargs):
+        call_count['count'] += 1
+        if call_count['count'] <= 2:
+            raise IOError("Simulated CSV write error")
+        return original_to_csv(self, *args, **kwargs)
+    
+    with patch.object(pd.DataFrame, 'to_csv', mock_to_csv):
+        # This should succeed after retries
+        csv_path = storage.export_saved_csv(result_id)
+    
+    # Verify the CSV was eventually written
+    assert call_count['count'] == 3
+    assert csv_path.exists()
+
+
+def test_history_rejects_unserializable_values(storage_dir, sample_results):
+    """
+    Test that history entries are not silently stringified.
+    
+    Requirements: 6.6
+    """
+    storage = StorageManager(results_dir=str(storage_dir))
+    
+    with pytest.raises(TypeError):
+        storage._add_to_history("result", sample_results, object())
@@ -4,10 +4,13 @@ Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
 Validates: Requirements 5.2
 """
 
-import tempfile
-import shutil
+import os
+import sys
+from functools import lru_cache
 from pathlib import Path
-from hypothesis import given, strategies as st, settings
+from types import ModuleType
+from uuid import uuid4
+from hypothesis import HealthCheck, given, strategies as st, settings
 import pytest
 
 from screener.strategies.discovery import (
@@ -19,22 +22,8 @@ from screener.strategies.base import StrategyModule
 from screener.core.models import StockData, StrategyAnalysis
 
 
-# Helper function to create a valid strategy module file
-def create_strategy_file(directory: Path, strategy_name: str, class_name: str) -> Path:
-    """
-    Create a valid strategy module file in the given directory.
-    
-    Args:
-        directory: Directory to create the file in
-        strategy_name: Name to return from the strategy's name property
-        class_name: Name of the strategy class
-        
-    Returns:
-        Path to the created file
-    """
-    file_path = directory / f"{strategy_name.lower().replace(' ', '_')}_strategy.py"
-    
-    content = f'''"""Test strategy module."""
+# Source of a minimal valid strategy module; literal braces are doubled for str.format
+_STRATEGY_TEMPLATE = '''"""Test strategy module."""
 
 from screener.strategies.base import StrategyModule
 from screener.core.models import StockData, StrategyAnalysis
@@ -74,52 +63,93 @@ class {class_name}(StrategyModule):
             notes=[]
         )
 '''
+
+
+# Settings for properties that write and import several modules per example
+_DISCOVERY_SETTINGS = settings(max_examples=25, deadline=None, suppress_health_check=[HealthCheck.too_slow])
+
+
+@lru_cache(maxsize=512)
+def _render_strategy(strategy_name: str, class_name: str) -> bytes:
+    """Render a strategy module's source; Hypothesis replays often repeat a pair."""
+    return _STRATEGY_TEMPLATE.format(class_name=class_name, strategy_name=strategy_name).encode("utf-8")
+
+
+# Helper function to create a valid strategy module file
+def create_strategy_file(directory: Path, strategy_name: str, class_name: str) -> Path:
+    """
+    Create a valid strategy module file in the given directory.
+    
+    Args:
+        directory: Directory to create the file in
+        strategy_name: Name to return from the strategy's name property
+        class_name: Name of the strategy class
+        
+    Returns:
+        Path to the created file
+    """
+    return create_strategy_files(directory, [(strategy_name, class_name)])[0]
+
+
+def create_strategy_files(directory: Path, strategies) -> list[Path]:
+    """
+    Create several strategy module files, rendering every source before writing.
     
-    file_path.write_text(content)
-    return file_path
+    Args:
+        directory: Directory to create the files in
+        strategies: Iterable of ``(strategy_name, class_name)`` pairs
+        
+    Returns:
+        Paths to the created files, in the given order
+    """
+    files = [
+        (
+            directory / f"{strategy_name.lower().replace(' ', '_')}_strategy.py",
+            _render_strategy(strategy_name, class_name),
+        )
+        for strategy_name, class_name in strategies
+    ]
+    for file_path, source in files:
+        file_path.write_bytes(source)
+    return [file_path for file_path, _ in files]
 
 
-@settings(max_examples=100)
+@_DISCOVERY_SETTINGS
 @given(
     num_strategies=st.integers(min_value=1, max_value=5),
 )
-def test_discover_strategies_finds_all_valid_modules(num_strategies):
+def test_discover_strategies_finds_all_valid_modules(strategies_root, num_strategies):
     """
     Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
     
     For any valid strategy module file placed in the strategies directory,
     the system should automatically discover and register it.
     """
-    # Create a temporary directory for test strategies
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create multiple strategy files
-        created_strategies = []
-        for i in range(num_strategies):
-            strategy_name = f"Test Strategy {i}"
-            class_name = f"TestStrategy{i}"
-            create_strategy_file(temp_path, strategy_name, class_name)
-            created_strategies.append(strategy_name)
-        
-        # Discover strategies
-        discovered = discover_strategies(str(temp_path))
-        
-        # All created strategies should be discovered
-        assert len(discovered) == num_strategies, \
-            f"Expected {num_strategies} strategies, found {len(discovered)}"
-        
-        # Each created strategy should be in the discovered set
-        for strategy_name in created_strategies:
-            assert strategy_name in discovered, \
-                f"Strategy '{strategy_name}' should be discovered"
-            
-            # Verify it's a StrategyModule instance
-            assert isinstance(discovered[strategy_name], StrategyModule), \
-                f"Discovered strategy should be a StrategyModule instance"
+    # Examples share the worker's root, each in its own directory
+    temp_path = strategies_root / uuid4().hex
+    temp_path.mkdir()
+    
+    # Create multiple strategy files
+    created_strategies = [f"Test Strategy {i}" for i in range(num_strategies)]
+    create_strategy_files(temp_path, [(name, f"TestStrategy{i}") for i, name in enumerate(created_strategies)])
+    
+    # Discover strategies
+    discovered = discover_strategies(temp_path)
+    
+    # All created strategies should be discovered
+    assert len(discovered) == num_strategies, \
+        f"Expected {num_strategies} strategies, found {len(discovered)}"
+    
+    # Each created strategy should be in the discovered set
+    missing = set(created_strategies).difference(discovered)
+    assert not missing, f"Strategies {sorted(missing)} should be discovered"
+    
+    # Verify each is a StrategyModule instance
+    assert all(isinstance(strategy, StrategyModule) for strategy in discovered.values()), \
+        "Discovered strategies should be StrategyModule instances"
 
 
-@settings(max_examples=100)
+@settings(max_examples=100, deadline=None)
 @given(
     strategy_name=st.text(
         alphabet=st.characters(
@@ -131,149 +161,181 @@ def test_discover_strategies_finds_all_valid_modules(num_strategies):
         max_size=50
     ).filter(lambda x: x.strip() and '/' not in x and '\\' not in x),
 )
-def test_discovered_strategy_has_correct_name(strategy_name):
+def test_discovered_strategy_has_correct_name(strategies_root, strategy_name):
     """
     Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
     
     For any discovered strategy, its name property should match the registered name.
     """
-    # Create a temporary directory for test strategies
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create a strategy file
-        class_name = "TestStrategy"
-        create_strategy_file(temp_path, strategy_name, class_name)
-        
-        # Discover strategies
-        discovered = discover_strategies(str(temp_path))
-        
-        # Strategy should be discovered with correct name
-        assert strategy_name in discovered, \
-            f"Strategy '{strategy_name}' should be discovered"
-        
-        # The name property should match
-        assert discovered[strategy_name].name == strategy_name, \
-            f"Strategy name property should be '{strategy_name}'"
+    # Examples share the worker's root, each in its own directory
+    temp_path = strategies_root / uuid4().hex
+    temp_path.mkdir()
+    
+    # Create a strategy file
+    class_name = "TestStrategy"
+    create_strategy_file(temp_path, strategy_name, class_name)
+    
+    # Discover strategies
+    discovered = discover_strategies(temp_path)
+    
+    # Strategy should be discovered with correct name
+    assert strategy_name in discovered, \
+        f"Strategy '{strategy_name}' should be discovered"
+    
+    # The name property should match
+    assert discovered[strategy_name].name == strategy_name, \
+        f"Strategy name property should be '{strategy_name}'"
 
 
-def test_discover_strategies_ignores_invalid_files():
+def test_discover_strategies_ignores_invalid_files(strategies_dir):
     """
     Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
     
     For any invalid or non-strategy files in the directory,
     discovery should skip them without failing.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create a valid strategy
-        create_strategy_file(temp_path, "Valid Strategy", "ValidStrategy")
-        
-        # Create an invalid Python file (no strategy class)
-        invalid_file = temp_path / "invalid_strategy.py"
-        invalid_file.write_text("# This file has no strategy class\nprint('hello')")
-        
-        # Create a non-Python file
-        non_python = temp_path / "readme_strategy.txt"
-        non_python.write_text("This is not a Python file")
-        
-        # Discover strategies - should only find the valid one
-        discovered = discover_strategies(str(temp_path))
-        
-        # Should find exactly one valid strategy
-        assert len(discovered) == 1, \
-            f"Should discover exactly 1 valid strategy, found {len(discovered)}"
-        assert "Valid Strategy" in discovered
+    # Create a valid strategy
+    create_strategy_file(strategies_dir, "Valid Strategy", "ValidStrategy")
+    
+    # Create an invalid Python file (no strategy class)
+    invalid_file = strategies_dir / "invalid_strategy.py"
+    invalid_file.write_text("# This file has no strategy class\nprint('hello')")
+    
+    # Create a non-Python file
+    non_python = strategies_dir / "readme_strategy.txt"
+    non_python.write_text("This is not a Python file")
+    
+    # Discover strategies - should only find the valid one
+    discovered = discover_strategies(strategies_dir)
+    
+    # Should find exactly one valid strategy
+    assert len(discovered) == 1, \
+        f"Should discover exactly 1 valid strategy, found {len(discovered)}"
+    assert "Valid Strategy" in discovered
 
 
-def test_get_strategy_returns_correct_strategy():
+def test_get_strategy_returns_correct_strategy(strategies_dir):
     """
     Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
     
     For any registered strategy name, get_strategy should return that strategy.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create multiple strategies
-        create_strategy_file(temp_path, "Strategy A", "StrategyA")
-        create_strategy_file(temp_path, "Strategy B", "StrategyB")
-        
-        # Get specific strategy
-        strategy_a = get_strategy("Strategy A", str(temp_path))
-        
-        # Should return the correct strategy
-        assert strategy_a.name == "Strategy A"
-        assert isinstance(strategy_a, StrategyModule)
+    # Create multiple strategies
+    create_strategy_files(strategies_dir, [("Strategy A", "StrategyA"), ("Strategy B", "StrategyB")])
+    
+    # Get specific strategy
+    strategy_a = get_strategy("Strategy A", strategies_dir)
+    
+    # Should return the correct strategy
+    assert strategy_a.name == "Strategy A"
+    assert isinstance(strategy_a, StrategyModule)
 
 
-def test_get_strategy_raises_error_for_unknown_strategy():
+def test_get_strategy_raises_error_for_unknown_strategy(strategies_dir):
     """
     Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
     
     For any unregistered strategy name, get_strategy should raise KeyError.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create one strategy
-        create_strategy_file(temp_path, "Known Strategy", "KnownStrategy")
-        
-        # Try to get unknown strategy
-        with pytest.raises(KeyError) as exc_info:
-            get_strategy("Unknown Strategy", str(temp_path))
-        
-        # Error message should be helpful
-        assert "Unknown Strategy" in str(exc_info.value)
-        assert "not found" in str(exc_info.value).lower()
+    # Create one strategy
+    create_strategy_file(strategies_dir, "Known Strategy", "KnownStrategy")
+    
+    # Try to get unknown strategy
+    with pytest.raises(KeyError) as exc_info:
+        get_strategy("Unknown Strategy", strategies_dir)
+    
+    # Error message should be helpful
+    assert "Unknown Strategy" in str(exc_info.value)
+    assert "not found" in str(exc_info.value).lower()
 
 
-def test_list_available_strategies_returns_all_names():
+def test_list_available_strategies_returns_all_names(strategies_dir):
     """
     Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
     
     For any set of discovered strategies, list_available_strategies
     should return all strategy names.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create multiple strategies
-        expected_names = ["Strategy X", "Strategy Y", "Strategy Z"]
-        for i, name in enumerate(expected_names):
-            create_strategy_file(temp_path, name, f"Strategy{chr(88+i)}")
-        
-        # List available strategies
-        available = list_available_strategies(str(temp_path))
-        
-        # Should return all strategy names
-        assert len(available) == len(expected_names)
-        for name in expected_names:
-            assert name in available
+    # Create multiple strategies
+    expected_names = ["Strategy X", "Strategy Y", "Strategy Z"]
+    create_strategy_files(strategies_dir, [(name, f"Strategy{chr(88+i)}") for i, name in enumerate(expected_names)])
+    
+    # List available strategies
+    available = list_available_strategies(strategies_dir)
+    
+    # Should return all strategy names
+    assert len(available) == len(expected_names)
+    assert set(expected_names).issubset(available)
 
 
-@settings(max_examples=100)
-@given(
-    num_strategies=st.integers(min_value=0, max_value=10),
-)
-def test_discover_strategies_count_matches_files(num_strategies):
+def test_discover_strategies_reuses_unchanged_directory(strategies_dir):
+    """Repeated lookups reuse the imported class but return fresh instances."""
+    create_strategy_file(strategies_dir, "Cached Strategy", "CachedStrategy")
+    
+    first = get_strategy("Cached Strategy", strategies_dir)
+    second = get_strategy("Cached Strategy", strategies_dir)
+    
+    assert type(first) is type(second)
+    assert first is not second
+
+
+def test_discover_strategies_sees_same_size_rewrite(strategies_dir):
+    """A rewrite that keeps the file size is picked up once the mtime moves."""
+    path = create_strategy_file(strategies_dir, "Strategy A", "StrategyA")
+    assert list_available_strategies(strategies_dir) == ["Strategy A"]
+    
+    stat = path.stat()
+    path.write_bytes(_render_strategy("Strategy B", "StrategyB"))
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    
+    assert path.stat().st_size == stat.st_size
+    assert list_available_strategies(strategies_dir) == ["Strategy B"]
+
+
+def test_discover_strategies_retries_failed_imports(strategies_dir, monkeypatch):
+    """A failed import is not cached, so the unchanged file loads once it can."""
+    source = b"import _discovery_test_dependency\n" + _render_strategy("Late Strategy", "LateStrategy")
+    (strategies_dir / "late_strategy.py").write_bytes(source)
+    assert list_available_strategies(strategies_dir) == []
+    
+    monkeypatch.setitem(sys.modules, "_discovery_test_dependency", ModuleType("_discovery_test_dependency"))
+    
+    assert list_available_strategies(strategies_dir) == ["Late Strategy"]
+
+
+def test_discover_strategies_sees_added_files(strategies_dir):
+    """Adding a strategy file invalidates the cached discovery result."""
+    create_strategy_file(strategies_dir, "First Strategy", "FirstStrategy")
+    assert list_available_strategies(strategies_dir) == ["First Strategy"]
+    
+    create_strategy_file(strategies_dir, "Second Strategy", "SecondStrategy")
+    
+    assert sorted(list_available_strategies(strategies_dir)) == ["First Strategy", "Second Strategy"]
+
+
+def test_discover_strategies_matches_glob_names(strategies_dir):
+    """Discovery finds exactly the files Path.glob("*_strategy.py") matches, dotfiles included."""
+    (strategies_dir / ".hidden_strategy.py").write_bytes(_render_strategy("Hidden Strategy", "HiddenStrategy"))
+    (strategies_dir / "helper.py").write_bytes(_render_strategy("Helper Strategy", "HelperStrategy"))
+    
+    assert sorted(p.name for p in strategies_dir.glob("*_strategy.py")) == [".hidden_strategy.py"]
+    assert list_available_strategies(strategies_dir) == ["Hidden Strategy"]
+
+
+@pytest.mark.parametrize("num_strategies", [0, 1, 5, 10])
+def test_discover_strategies_count_matches_files(strategies_dir, num_strategies):
     """
     Feature: strategy-stock-screener, Property 15: Strategy Plugin Discovery
     
     For any number of valid strategy files, the number of discovered
     strategies should match the number of files.
     """
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        
-        # Create strategy files
-        for i in range(num_strategies):
-            create_strategy_file(temp_path, f"Strategy {i}", f"Strategy{i}")
-        
-        # Discover strategies
-        discovered = discover_strategies(str(temp_path))
-        
-        # Count should match
-        assert len(discovered) == num_strategies, \
-            f"Expected {num_strategies} strategies, found {len(discovered)}"
+    # Create strategy files
+    create_strategy_files(strategies_dir, [(f"Strategy {i}", f"Strategy{i}") for i in range(num_strategies)])
+    
+    # Discover strategies
+    discovered = discover_strategies(strategies_dir)
+    
+    # Count should match
+    assert len(discovered) == num_strategies, \
+        f"Expected {num_strategies} strategies, found {len(discovered)}"